@@ -53,6 +53,11 @@ class EnvSettings(BaseSettings):
         """Path to the global config.toml file"""
         return self.global_config_dir / "config.toml"
 
+    @property
+    def cache_dir(self) -> Path:
+        """Per-user cache directory (GitHub response cache)"""
+        return Path.home() / ".cache" / "mem"
+
     @property
     def config_file(self) -> Path:
         """Path to the local config.toml file"""
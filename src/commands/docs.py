@@ -37,8 +37,6 @@ def index():
         typer.echo("✅ All documents are up to date. Nothing to index.")
         return
 
-    hashes = docs.load_doc_hashes()
-
     if deleted_slugs:
         typer.echo(f"\n🗑️  Removing {len(deleted_slugs)} deleted document(s)...")
         for slug in deleted_slugs:
@@ -47,8 +45,7 @@ def index():
                 docs.delete_doc_from_index(slug)
             except Exception as e:
                 typer.echo(f"    ⚠️  Warning: Could not remove from index: {e}")
-            if slug in hashes:
-                del hashes[slug]
+            docs.delete_doc_hash(slug)
             summary_path = docs.get_summary_path(slug)
             if summary_path.exists():
                 summary_path.unlink()
@@ -61,17 +58,13 @@ def index():
             action = "changed" if is_changed else "new"
             typer.echo(f"  - {slug} ({action})")
 
-            doc_path = docs.get_doc_path(slug)
-            content = doc_path.read_text()
-
-            if is_changed:
-                try:
-                    docs.delete_doc_from_index(slug)
-                    typer.echo("    🗑️  Cleared old index data")
-                except Exception as e:
-                    typer.echo(f"    ⚠️  Warning: Could not clear old index: {e}")
+            raw = docs.read_doc_bytes(slug)
+            if raw is None:
+                typer.echo("    ❌ Failed to index: document no longer exists")
+                continue
 
             try:
+                content = raw.decode("utf-8")
                 chunk_count = docs.index_document(slug, content)
                 typer.echo(f"    ✅ Indexed {chunk_count} chunk(s)")
             except Exception as e:
@@ -94,9 +87,7 @@ def index():
             except Exception as e:
                 typer.echo(f"    ⚠️  Summary generation failed: {e}")
 
-            hashes[slug] = docs.compute_file_hash(doc_path)
-
-    docs.save_doc_hashes(hashes)
+            docs.set_doc_hash(slug, docs.compute_bytes_hash(raw))
 
     typer.echo("\n✅ Indexing complete.")
     typer.echo(
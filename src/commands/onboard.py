@@ -156,7 +156,7 @@ def format_spec_detail(spec: dict[str, Any]) -> str:
         output.append(body)
 
     # List tasks
-    task_list = tasks.list_tasks(spec["slug"])
+    task_list = tasks.list_tasks(spec["slug"], include_body=False)
     if task_list:
         output.append("\n### Tasks:")
         for task in task_list:
@@ -181,7 +181,7 @@ def format_spec_summary(spec: dict[str, Any]) -> str:
         output.append(f"\n{preview}")
 
     # Task summary
-    task_list = tasks.list_tasks(spec["slug"])
+    task_list = tasks.list_tasks(spec["slug"], include_body=False)
     if task_list:
         completed = sum(1 for t in task_list if t["status"] == "completed")
         output.append(f"\nTasks: {completed}/{len(task_list)} completed")
@@ -194,7 +194,7 @@ def format_next_steps(active_spec: dict | None, branch_name: str) -> str:
     steps = []
 
     if active_spec:
-        task_list = tasks.list_tasks(active_spec["slug"])
+        task_list = tasks.list_tasks(active_spec["slug"], include_body=False)
 
         # Find incomplete tasks
         pending = [t for t in task_list if t["status"] != "completed"]
@@ -635,7 +635,7 @@ def onboard(
 
     # Open todos (goes to file)
     try:
-        open_todos = todos.list_todos(status="open")
+        open_todos = todos.list_todos(status="open", include_body=False)
         if open_todos:
             file_sections.append("-" * 70)
             file_sections.append("📌 OPEN TODOS")
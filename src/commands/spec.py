@@ -518,7 +518,7 @@ def complete(
             raise typer.Exit(code=1)
 
         # 3. Validate tasks
-        task_list = tasks.list_tasks(spec_slug)
+        task_list = tasks.list_tasks(spec_slug, include_body=False)
         incomplete_tasks = [task for task in task_list if task["status"] != "completed"]
 
         if incomplete_tasks:
@@ -547,9 +547,12 @@ def execute_outbound_create(repo: Any, spec: dict[str, Any]) -> None:
     # Update spec with issue info
     specs.update_spec_issue_info(spec["slug"], issue.number, issue.html_url)
 
-    # Store content hashes
+    # Store content hashes (GitHub usually echoes the body back unchanged)
     local_hash = compute_content_hash(body)
-    remote_hash = compute_content_hash(issue.body or "")
+    remote_body = issue.body or ""
+    remote_hash = (
+        local_hash if remote_body == body else compute_content_hash(remote_body)
+    )
     specs.mark_spec_synced(spec["slug"], local_hash, remote_hash)
 
     typer.echo(f'   ✓ Created issue #{issue.number} for spec "{spec["slug"]}"')
@@ -564,9 +567,12 @@ def execute_outbound_update(repo: Any, spec: dict[str, Any]) -> None:
     # Update the issue
     issue = update_github_issue(repo, spec["issue_id"], body=body)
 
-    # Store content hashes
+    # Store content hashes (GitHub usually echoes the body back unchanged)
     local_hash = compute_content_hash(body)
-    remote_hash = compute_content_hash(issue.body or "")
+    remote_body = issue.body or ""
+    remote_hash = (
+        local_hash if remote_body == body else compute_content_hash(remote_body)
+    )
     specs.mark_spec_synced(spec["slug"], local_hash, remote_hash)
 
     typer.echo(f'   ✓ Updated issue #{spec["issue_id"]} from spec "{spec["slug"]}"')
@@ -678,7 +684,7 @@ def execute_status_sync(
         # Local -> GitHub
         local_status = spec.get("status")
         if local_status:
-            sync_status_labels(repo, issue.number, local_status)
+            sync_status_labels(repo, issue, local_status)
             typer.echo(f"   ✓ Updated issue #{issue.number} labels to '{local_status}'")
 
 
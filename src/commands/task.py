@@ -293,7 +293,7 @@ def complete(
         typer.echo("")
 
         # Check if all tasks are now complete
-        task_list = tasks.list_tasks(resolved_slug)
+        task_list = tasks.list_tasks(resolved_slug, include_body=False)
         pending = [t for t in task_list if t["status"] != "completed"]
 
         if not pending and task_list:
@@ -359,11 +359,14 @@ def amend(
     try:
         resolved_slug = _resolve_spec_slug(spec_slug)
         task_filename = _find_task_by_title(resolved_slug, title)
-        tasks.amend_task(resolved_slug, task_filename, notes)
 
+        # Read before amending: amend_task's own read is then a cache hit and
+        # the rewritten file is not parsed again just to print its title
         task = tasks.get_task(resolved_slug, task_filename)
         assert task is not None
 
+        tasks.amend_task(resolved_slug, task_filename, notes)
+
         typer.echo(f"📝 Amended task: {task['title']}")
         typer.echo("  Status reset to: todo")
         typer.echo("")
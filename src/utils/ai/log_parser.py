@@ -3,19 +3,23 @@ Log parser agent for converting old agent_rules work logs to mem format.
 """
 
 import json
+import threading
 
 from agno.agent import Agent
 from agno.models.openrouter import OpenRouter
 
 from src.utils.ai.models import ParsedLog
 
-model = OpenRouter("google/gemini-3-flash-preview", max_tokens=8192)
+# Agents keep per-run session state, so each thread gets its own
+_local = threading.local()
 
-log_parser_agent = Agent(
-    model=model,
-    name="Log Parser Agent",
-    instructions=[
-        """You are an expert at parsing work log files and cleaning them up.
+
+def _build_log_parser_agent() -> Agent:
+    return Agent(
+        model=OpenRouter("google/gemini-3-flash-preview", max_tokens=8192),
+        name="Log Parser Agent",
+        instructions=[
+            """You are an expert at parsing work log files and cleaning them up.
 
 Given an old work log file, extract and clean the content.
 
@@ -25,9 +29,17 @@ When cleaning the body:
 - Clean up any formatting issues
 - Keep the content concise and well-structured
 """
-    ],
-    output_schema=ParsedLog,
-)
+        ],
+        output_schema=ParsedLog,
+    )
+
+
+def _get_log_parser_agent() -> Agent:
+    """Return this thread's log parser agent, building it on first use."""
+    agent = getattr(_local, "agent", None)
+    if agent is None:
+        agent = _local.agent = _build_log_parser_agent()
+    return agent
 
 
 def parse_log(content: str) -> ParsedLog | None:
@@ -35,7 +47,7 @@ def parse_log(content: str) -> ParsedLog | None:
 
     Returns ParsedLog if successful, None if parsing fails.
     """
-    response = log_parser_agent.run(f"Parse this work log file:\n\n{content}")
+    response = _get_log_parser_agent().run(f"Parse this work log file:\n\n{content}")
 
     if isinstance(response.content, ParsedLog):
         return response.content
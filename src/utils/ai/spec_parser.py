@@ -3,19 +3,23 @@ Spec parser agent for converting old agent_rules specs to mem format.
 """
 
 import json
+import threading
 
 from agno.agent import Agent
 from agno.models.openrouter import OpenRouter
 
 from src.utils.ai.models import ParsedSpec
 
-model = OpenRouter("google/gemini-3-flash-preview", max_tokens=8192)
+# Agents keep per-run session state, so each thread gets its own
+_local = threading.local()
 
-spec_parser_agent = Agent(
-    model=model,
-    name="Spec Parser Agent",
-    instructions=[
-        """You are an expert at parsing semi-structured markdown spec files and converting them to a structured format.
+
+def _build_spec_parser_agent() -> Agent:
+    return Agent(
+        model=OpenRouter("google/gemini-3-flash-preview", max_tokens=8192),
+        name="Spec Parser Agent",
+        instructions=[
+            """You are an expert at parsing semi-structured markdown spec files and converting them to a structured format.
 
 Given an old spec file, extract:
 1. title: The spec title (from the first heading)
@@ -34,9 +38,17 @@ When extracting tasks:
 - The task title is the text after "Task:" or "Task N:" (e.g. "Create Database Migration")
 - Include everything under the task heading in the description (checkbox items, implementation details, etc.)
 """
-    ],
-    output_schema=ParsedSpec,
-)
+        ],
+        output_schema=ParsedSpec,
+    )
+
+
+def _get_spec_parser_agent() -> Agent:
+    """Return this thread's spec parser agent, building it on first use."""
+    agent = getattr(_local, "agent", None)
+    if agent is None:
+        agent = _local.agent = _build_spec_parser_agent()
+    return agent
 
 
 def parse_spec(content: str) -> ParsedSpec | None:
@@ -44,7 +56,7 @@ def parse_spec(content: str) -> ParsedSpec | None:
 
     Returns ParsedSpec if successful, None if parsing fails.
     """
-    response = spec_parser_agent.run(f"Parse this spec file:\n\n{content}")
+    response = _get_spec_parser_agent().run(f"Parse this spec file:\n\n{content}")
 
     if isinstance(response.content, ParsedSpec):
         return response.content
@@ -5,9 +5,13 @@ Documents are stored as markdown files in .mem/docs/ and indexed into ChromaDB
 for semantic search. AI-generated summaries are stored in .mem/docs/summaries/.
 """
 
+import functools
 import hashlib
 import json
 import os
+import re
+import sqlite3
+import threading
 import tomllib
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -18,12 +22,52 @@ if TYPE_CHECKING:
     import chromadb
     from agno.knowledge.document import Document
 
+_UNSAFE_COLLECTION_CHARS_RE = re.compile(r"[^A-Za-z0-9_]")
 
-def _read_config() -> dict:
-    """Read local config file. Simplified version to avoid circular imports."""
-    config_file = ENV_SETTINGS.config_file
-    if not config_file.exists():
-        return {}
+# MarkdownChunking settings used when splitting documents for the index.
+CHUNK_SIZE = 5000
+CHUNK_OVERLAP = 200
+SPLIT_ON_HEADINGS = 2
+
+# Use the built-in heading splitter instead of agno's MarkdownChunking. Both
+# produce the same chunks; set to False to fall back to MarkdownChunking.
+FAST_CHUNKING = True
+
+_HEADING_LINE_RE = re.compile(r"^#{1,6}\s+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\n+")
+
+# Chunks per upsert call. Chroma embeds each upsert in one request, so this
+# also bounds the size of every embedding call to VoyageAI.
+UPSERT_BATCH_SIZE = 64
+
+_chroma_lock = threading.Lock()
+_chroma_clients: dict[str, "chromadb.ClientAPI"] = {}
+_chroma_collections: dict[tuple[str, str], "chromadb.Collection"] = {}
+
+# Open hash store connections per database path, see _connect_hashes_db
+_hashes_lock = threading.Lock()
+_hashes_conns: dict[Path, sqlite3.Connection] = {}
+
+
+@functools.cache
+def _chromadb():
+    """Import chromadb on first use. It is slow to import and only needed for indexing."""
+    import chromadb
+
+    return chromadb
+
+
+@functools.cache
+def _document_class() -> type["Document"]:
+    """Import agno's Document class on first use."""
+    from agno.knowledge.document import Document
+
+    return Document
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(config_file: Path, mtime_ns: int) -> dict:
+    """Parse a config file. Cached per path and modification time."""
     try:
         with open(config_file, "rb") as f:
             return tomllib.load(f)
@@ -31,6 +75,22 @@ def _read_config() -> dict:
         return {}
 
 
+def _read_config() -> dict:
+    """Read local config file. Simplified version to avoid circular imports."""
+    config_file = ENV_SETTINGS.config_file
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _load_config(config_file, mtime_ns)
+
+
+def reload_config() -> None:
+    """Drop cached config so the next read goes back to disk."""
+    _load_config.cache_clear()
+    _sanitize_collection_name.cache_clear()
+
+
 def _get_docs_dir() -> Path:
     """Get the docs directory path."""
     return ENV_SETTINGS.mem_dir / "docs"
@@ -56,11 +116,21 @@ def _get_chroma_dir() -> Path:
     return _get_data_dir() / "chroma"
 
 
+def _get_hashes_db() -> Path:
+    """Get the path to the SQLite store of document and chunk hashes."""
+    return _get_data_dir() / "doc_hashes.db"
+
+
 def _get_hashes_file() -> Path:
-    """Get the path to the document hashes file."""
+    """Get the path to the legacy JSON document hashes file."""
     return _get_data_dir() / ".doc_hashes.json"
 
 
+def _get_chunk_hashes_file() -> Path:
+    """Get the path to the legacy JSON chunk hashes file."""
+    return _get_data_dir() / ".doc_chunks.json"
+
+
 def ensure_docs_dirs() -> None:
     """Ensure all docs directories exist."""
     _get_docs_dir().mkdir(parents=True, exist_ok=True)
@@ -75,55 +145,206 @@ def get_doc_slug(file_path: Path) -> str:
     return file_path.stem
 
 
+def compute_bytes_hash(data: bytes) -> str:
+    """Compute SHA256 hash of raw document bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
 def compute_file_hash(file_path: Path) -> str:
     """Compute SHA256 hash of file contents."""
-    content = file_path.read_text()
-    return hashlib.sha256(content.encode()).hexdigest()
+    return compute_bytes_hash(file_path.read_bytes())
+
+
+_HASHES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    slug TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunk_hashes (
+    slug TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (slug, chunk_index)
+);
+"""
 
 
-def load_doc_hashes() -> dict[str, str]:
-    """Load stored document hashes from JSON file."""
-    hashes_file = _get_hashes_file()
-    if not hashes_file.exists():
-        return {}
+def _read_legacy_json(path: Path) -> dict:
+    """Read a legacy JSON hash file, returning {} if missing or unreadable."""
     try:
-        return json.loads(hashes_file.read_text())
-    except (json.JSONDecodeError, OSError):
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+
+
+def _import_legacy_hashes(conn: sqlite3.Connection) -> None:
+    """Copy hashes from the JSON files used before the SQLite store.
+
+    The JSON files are left in place. Chunk entries that only recorded a
+    count get empty hashes, so their ids are known but every chunk is
+    re-embedded on the next index.
+    """
+    doc_hashes = _read_legacy_json(_get_hashes_file())
+    conn.executemany(
+        "INSERT OR REPLACE INTO hashes (slug, sha256) VALUES (?, ?)",
+        doc_hashes.items(),
+    )
+
+    chunk_rows = []
+    for slug, value in _read_legacy_json(_get_chunk_hashes_file()).items():
+        chunk_hashes = value if isinstance(value, list) else [""] * value
+        chunk_rows.extend((slug, i, h) for i, h in enumerate(chunk_hashes))
+    conn.executemany(
+        "INSERT OR REPLACE INTO chunk_hashes (slug, chunk_index, sha256) VALUES (?, ?, ?)",
+        chunk_rows,
+    )
+
+
+def _connect_hashes_db() -> sqlite3.Connection | None:
+    """Get the hash store connection, creating the store on first use.
+
+    The connection is opened and the schema applied once per database path,
+    then reused for the rest of the process. A new store is seeded from the
+    legacy JSON files. Returns None when there is nothing stored yet and the
+    data directory does not exist, so read-only callers do not create it.
+    """
+    db_path = _get_hashes_db()
+    with _hashes_lock:
+        conn = _hashes_conns.get(db_path)
+        if conn is not None:
+            return conn
+
+        is_new = not db_path.exists()
+        if is_new and not db_path.parent.exists():
+            return None
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        if is_new:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.executescript(_HASHES_SCHEMA)
+            if is_new:
+                _import_legacy_hashes(conn)
+
+        _hashes_conns[db_path] = conn
+        return conn
+
+
+def reset_hashes_cache() -> None:
+    """Close and forget cached hash store connections."""
+    with _hashes_lock:
+        for conn in _hashes_conns.values():
+            conn.close()
+        _hashes_conns.clear()
+
+
+def _open_hashes_db() -> sqlite3.Connection:
+    """Open the hash store for writing, creating the data directory if needed."""
+    conn = _connect_hashes_db()
+    if conn is None:
+        ensure_docs_dirs()
+        conn = _connect_hashes_db()
+        assert conn is not None
+    return conn
+
+
+def load_doc_hashes() -> dict[str, str]:
+    """Load stored document hashes."""
+    conn = _connect_hashes_db()
+    if conn is None:
         return {}
+    return dict(conn.execute("SELECT slug, sha256 FROM hashes"))
 
 
 def save_doc_hashes(hashes: dict[str, str]) -> None:
-    """Save document hashes to JSON file."""
-    ensure_docs_dirs()
-    _get_hashes_file().write_text(json.dumps(hashes, indent=2))
+    """Replace all stored document hashes."""
+    conn = _open_hashes_db()
+    with conn:
+        conn.execute("DELETE FROM hashes")
+        conn.executemany(
+            "INSERT INTO hashes (slug, sha256) VALUES (?, ?)", hashes.items()
+        )
 
 
-def list_doc_files() -> list[Path]:
-    """List all markdown files in docs directory (excluding core/, summaries/, and data/)."""
-    docs_dir = _get_docs_dir()
-    if not docs_dir.exists():
-        return []
+def set_doc_hash(slug: str, file_hash: str) -> None:
+    """Store the hash of a single document."""
+    conn = _open_hashes_db()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO hashes (slug, sha256) VALUES (?, ?)",
+            (slug, file_hash),
+        )
 
-    doc_files = []
-    for file_path in docs_dir.iterdir():
-        if file_path.is_file() and file_path.suffix == ".md":
-            doc_files.append(file_path)
 
-    return sorted(doc_files, key=lambda p: p.name)
+def delete_doc_hash(slug: str) -> None:
+    """Forget the stored hash of a single document."""
+    conn = _connect_hashes_db()
+    if conn is None:
+        return
+    with conn:
+        conn.execute("DELETE FROM hashes WHERE slug = ?", (slug,))
 
 
-def list_core_doc_files() -> list[Path]:
-    """List all markdown files in the core docs directory."""
-    core_dir = _get_core_docs_dir()
-    if not core_dir.exists():
+def _get_chunk_hashes(slug: str) -> list[str] | None:
+    """Get the content hash of each indexed chunk of a document, by chunk index.
+
+    Returns None if the document's chunks were never recorded.
+    """
+    conn = _connect_hashes_db()
+    if conn is None:
+        return None
+    rows = conn.execute(
+        "SELECT sha256 FROM chunk_hashes WHERE slug = ? ORDER BY chunk_index",
+        (slug,),
+    ).fetchall()
+    if not rows:
+        return None
+    return [row[0] for row in rows]
+
+
+def _set_chunk_hashes(slug: str, chunk_hashes: list[str]) -> None:
+    """Replace the recorded chunk hashes of a document."""
+    conn = _open_hashes_db()
+    with conn:
+        conn.execute("DELETE FROM chunk_hashes WHERE slug = ?", (slug,))
+        conn.executemany(
+            "INSERT INTO chunk_hashes (slug, chunk_index, sha256) VALUES (?, ?, ?)",
+            [(slug, i, h) for i, h in enumerate(chunk_hashes)],
+        )
+
+
+def _delete_chunk_hashes(slug: str) -> None:
+    """Forget the recorded chunk hashes of a document."""
+    conn = _connect_hashes_db()
+    if conn is None:
+        return
+    with conn:
+        conn.execute("DELETE FROM chunk_hashes WHERE slug = ?", (slug,))
+
+
+def _scan_md_files(directory: Path) -> list[Path]:
+    """List markdown files directly inside a directory, sorted by name."""
+    try:
+        with os.scandir(directory) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
 
-    doc_files = []
-    for file_path in core_dir.iterdir():
-        if file_path.is_file() and file_path.suffix == ".md":
-            doc_files.append(file_path)
+    return [directory / name for name in sorted(names)]
+
+
+def list_doc_files() -> list[Path]:
+    """List all markdown files in docs directory (excluding core/, summaries/, and data/)."""
+    return _scan_md_files(_get_docs_dir())
+
 
-    return sorted(doc_files, key=lambda p: p.name)
+def list_core_doc_files() -> list[Path]:
+    """List all markdown files in the core docs directory."""
+    return _scan_md_files(_get_core_docs_dir())
 
 
 def get_core_doc_slug(file_path: Path) -> str:
@@ -141,7 +362,15 @@ def read_core_doc(slug: str) -> str | None:
     doc_path = get_core_doc_path(slug)
     if not doc_path.exists():
         return None
-    return doc_path.read_text()
+    return doc_path.read_text(encoding="utf-8")
+
+
+def read_core_doc_bytes(slug: str) -> bytes | None:
+    """Read raw core document bytes by slug. Returns None if not found."""
+    try:
+        return get_core_doc_path(slug).read_bytes()
+    except FileNotFoundError:
+        return None
 
 
 def get_doc_path(slug: str) -> Path:
@@ -159,7 +388,18 @@ def read_doc(slug: str) -> str | None:
     doc_path = get_doc_path(slug)
     if not doc_path.exists():
         return None
-    return doc_path.read_text()
+    return doc_path.read_text(encoding="utf-8")
+
+
+def read_doc_bytes(slug: str) -> bytes | None:
+    """Read raw document bytes by slug. Returns None if not found.
+
+    Used by indexing so the same bytes can be hashed and decoded once.
+    """
+    try:
+        return get_doc_path(slug).read_bytes()
+    except FileNotFoundError:
+        return None
 
 
 def read_summary(slug: str) -> str | None:
@@ -167,14 +407,14 @@ def read_summary(slug: str) -> str | None:
     summary_path = get_summary_path(slug)
     if not summary_path.exists():
         return None
-    return summary_path.read_text()
+    return summary_path.read_text(encoding="utf-8")
 
 
 def write_summary(slug: str, content: str) -> None:
     """Write summary content for a document."""
     ensure_docs_dirs()
     summary_path = get_summary_path(slug)
-    summary_path.write_text(content)
+    summary_path.write_text(content, encoding="utf-8")
 
 
 def delete_doc(slug: str) -> bool:
@@ -184,7 +424,7 @@ def delete_doc(slug: str) -> bool:
     - The document file (.mem/docs/{slug}.md)
     - The summary file (.mem/docs/summaries/{slug}_summary.md)
     - All chunks from ChromaDB
-    - The hash entry from .doc_hashes.json
+    - The stored document hash
 
     Returns True if document existed and was deleted, False otherwise.
     """
@@ -201,91 +441,276 @@ def delete_doc(slug: str) -> bool:
     try:
         delete_doc_from_index(slug)
     except Exception:
-        pass
+        reset_chroma_cache()
 
-    hashes = load_doc_hashes()
-    if slug in hashes:
-        del hashes[slug]
-        save_doc_hashes(hashes)
+    delete_doc_hash(slug)
 
     return True
 
 
+@functools.cache
+def _sanitize_collection_name(project_name: str) -> str:
+    """Turn a project name into a valid ChromaDB collection name."""
+    safe_name = _UNSAFE_COLLECTION_CHARS_RE.sub("_", project_name)
+    return f"{safe_name}_docs"
+
+
 def _get_collection_name() -> str:
     """Get ChromaDB collection name based on project name."""
     config = _read_config()
     project = config.get("project", {})
     project_name = project.get("name", "default")
-    safe_name = "".join(c if c.isalnum() or c == "_" else "_" for c in project_name)
-    return f"{safe_name}_docs"
+    return _sanitize_collection_name(project_name)
 
 
-def _get_embedding_function():
-    """Create VoyageAI embedding function."""
+@functools.cache
+def _make_embedding_function(api_key: str):
+    """Build a VoyageAI embedding function, reused per API key."""
     from chromadb.utils.embedding_functions import VoyageAIEmbeddingFunction
 
-    api_key = os.getenv("VOYAGE_AI_API_KEY")
-    if not api_key:
-        raise ValueError("VOYAGE_AI_API_KEY environment variable is required")
     return VoyageAIEmbeddingFunction(
         api_key=api_key,
         model_name="voyage-3-large",
     )
 
 
-def get_chroma_client() -> "chromadb.ClientAPI":
-    """Get ChromaDB persistent client."""
-    import chromadb
+def _get_embedding_function():
+    """Create VoyageAI embedding function."""
+    api_key = os.getenv("VOYAGE_AI_API_KEY")
+    if not api_key:
+        raise ValueError("VOYAGE_AI_API_KEY environment variable is required")
+    return _make_embedding_function(api_key)
 
-    ensure_docs_dirs()
-    return chromadb.PersistentClient(path=str(_get_chroma_dir()))
+
+def reset_chroma_cache() -> None:
+    """Forget cached ChromaDB clients and collections."""
+    with _chroma_lock:
+        _chroma_collections.clear()
+        _chroma_clients.clear()
+
+
+def get_chroma_client() -> "chromadb.ClientAPI":
+    """Get ChromaDB persistent client, reused per storage directory."""
+    chroma_dir = str(_get_chroma_dir())
+    with _chroma_lock:
+        client = _chroma_clients.get(chroma_dir)
+        if client is None:
+            ensure_docs_dirs()
+            client = _chromadb().PersistentClient(path=chroma_dir)
+            _chroma_clients[chroma_dir] = client
+        return client
 
 
 def get_collection() -> "chromadb.Collection":
-    """Get or create the docs ChromaDB collection."""
+    """Get or create the docs ChromaDB collection.
+
+    Collections are cached per storage directory and collection name, so a
+    changed project name or working directory gets its own collection.
+    """
+    key = (str(_get_chroma_dir()), _get_collection_name())
+    with _chroma_lock:
+        collection = _chroma_collections.get(key)
+    if collection is not None:
+        return collection
+
     client = get_chroma_client()
     embedding_fn = _get_embedding_function()
-    return client.get_or_create_collection(
-        name=_get_collection_name(),
+    collection = client.get_or_create_collection(
+        name=key[1],
         embedding_function=embedding_fn,  # type: ignore
     )
+    with _chroma_lock:
+        return _chroma_collections.setdefault(key, collection)
 
 
-def chunk_document(slug: str, content: str) -> list["Document"]:
-    """Chunk a document using MarkdownChunking.
-
-    Returns list of Document objects with metadata.
-    """
+@functools.cache
+def _get_chunker():
+    """Get the shared MarkdownChunking instance."""
     from agno.knowledge.chunking.markdown import MarkdownChunking
-    from agno.knowledge.document import Document
 
-    doc = Document(
-        content=content,
-        id=slug,
-        name=slug,
-        meta_data={"doc_slug": slug},
+    return MarkdownChunking(
+        chunk_size=CHUNK_SIZE,
+        overlap=CHUNK_OVERLAP,
+        split_on_headings=SPLIT_ON_HEADINGS,
     )
 
-    chunker = MarkdownChunking(
-        chunk_size=5000,
-        overlap=200,
-        split_on_headings=2,
-    )
 
-    return chunker.chunk(doc)
+@functools.cache
+def _heading_split_re(max_level: int) -> re.Pattern[str]:
+    """Regex matching heading lines at or above max_level, as a split delimiter."""
+    return re.compile(rf"(^#{{1,{max_level}}}\s+.+$)", re.MULTILINE)
+
+
+def _split_sections(content: str, max_level: int) -> list[str]:
+    """Split markdown into sections that each start with a heading."""
+    heading_re = _heading_split_re(max_level)
+    sections = []
+    current = ""
+
+    for part in heading_re.split(content):
+        stripped = part.strip()
+        if not stripped:
+            continue
+        if heading_re.match(stripped):
+            if current.strip():
+                sections.append(current.strip())
+            current = part
+        else:
+            current = current + "\n\n" + part if current else part
+
+    if current.strip():
+        sections.append(current.strip())
+
+    return sections or [content]
+
+
+def _split_large_section(section: str, chunk_size: int) -> list[str]:
+    """Split an oversized section on paragraphs, then words, repeating its heading.
+
+    Keeps running totals of the pending chunk size so each paragraph is
+    measured once, rather than re-summing the pending chunk per paragraph.
+    """
+    if len(section) <= chunk_size:
+        return [section]
+
+    first_line, _, rest = section.partition("\n")
+    if _HEADING_LINE_RE.match(first_line):
+        heading = first_line
+        body = rest.strip()
+    else:
+        heading = ""
+        body = section.strip()
+
+    if not body:
+        return [section]
+
+    prefix = heading + "\n\n" if heading else ""
+    heading_size = len(prefix)
+    chunks: list[str] = []
+    pending: list[str] = []
+    pending_size = 0  # len of pending paragraphs plus two per separator slot
+
+    for para in _PARAGRAPH_BREAK_RE.split(body):
+        para = para.strip()
+        if not para:
+            continue
+
+        if pending and heading_size + pending_size + len(para) + 2 > chunk_size:
+            chunks.append((prefix + "\n\n".join(pending)).strip())
+            pending = []
+            pending_size = 0
+
+        if len(para) + heading_size > chunk_size:
+            if pending:
+                chunks.append((prefix + "\n\n".join(pending)).strip())
+                pending = []
+                pending_size = 0
+
+            available = chunk_size - heading_size
+            words: list[str] = []
+            words_size = 0
+            for word in para.split():
+                if words and words_size + len(word) + 1 > available:
+                    chunks.append((prefix + " ".join(words)).strip())
+                    words = []
+                    words_size = 0
+                words.append(word)
+                words_size += len(word) + 1
+
+            if words:
+                pending.append(" ".join(words))
+                pending_size += len(pending[-1]) + 2
+        else:
+            pending.append(para)
+            pending_size += len(para) + 2
+
+    if pending:
+        chunks.append((prefix + "\n\n".join(pending)).strip())
+
+    return chunks or [section]
+
+
+def _fast_markdown_chunk(
+    content: str,
+    chunk_size: int = CHUNK_SIZE,
+    overlap: int = CHUNK_OVERLAP,
+    split_on_headings: int = SPLIT_ON_HEADINGS,
+) -> list[str]:
+    """Chunk markdown into heading sections capped at chunk_size characters.
+
+    Matches MarkdownChunking with an integer split_on_headings: every
+    section becomes one or more chunks, and each chunk after the first is
+    prefixed with the last `overlap` characters of the chunk before it.
+    Works directly on strings, so agno and unstructured are never imported.
+    """
+    chunks = []
+    for section in _split_sections(content, split_on_headings):
+        chunks.extend(_split_large_section(section.strip(), chunk_size))
+
+    if overlap > 0:
+        chunks = chunks[:1] + [
+            previous[-overlap:] + chunk for previous, chunk in zip(chunks, chunks[1:])
+        ]
+
+    return chunks
+
+
+def chunk_document(slug: str, content: str) -> list["Document"]:
+    """Chunk a document using MarkdownChunking.
+
+    With FAST_CHUNKING enabled the equivalent _fast_markdown_chunk is used
+    instead. Returns list of Document objects with metadata.
+    """
+    document_class = _document_class()
+    meta_data = {"doc_slug": slug}
+
+    if not FAST_CHUNKING or not content:
+        doc = document_class(
+            content=content,
+            id=slug,
+            name=slug,
+            meta_data=meta_data,
+        )
+        return _get_chunker().chunk(doc)
+
+    return [
+        document_class(
+            id=f"{slug}_{number}",
+            name=slug,
+            meta_data={**meta_data, "chunk": number, "chunk_size": len(text)},
+            content=text,
+        )
+        for number, text in enumerate(_fast_markdown_chunk(content), start=1)
+    ]
 
 
 def index_document(slug: str, content: str) -> int:
     """Index a document into ChromaDB.
 
-    Chunks the document and upserts all chunks.
-    Returns the number of chunks indexed.
+    Chunks the document and upserts only the chunks whose content hash
+    differs from the last index (or that are missing from the collection),
+    in batches of UPSERT_BATCH_SIZE. Chunks left over from a longer previous
+    version are deleted. Returns the number of chunks in the document.
     """
     chunks = chunk_document(slug, content)
-    if not chunks:
-        return 0
-
     collection = get_collection()
+    previous = _get_chunk_hashes(slug)
+    if previous is None:
+        # No chunk hashes were recorded (e.g. indexed by an older version), so
+        # the stored chunk count is unknown: clear every chunk of the document
+        # by metadata before upserting
+        delete_doc_from_index(slug)
+        previous = []
+    current = [hashlib.sha256(chunk.content.encode()).hexdigest() for chunk in chunks]
+
+    unchanged_ids = [
+        f"{slug}_{i}"
+        for i, chunk_hash in enumerate(current)
+        if i < len(previous) and previous[i] == chunk_hash
+    ]
+    present = set()
+    if unchanged_ids:
+        present = set(collection.get(ids=unchanged_ids, include=[])["ids"])
 
     ids = []
     documents = []
@@ -293,6 +718,8 @@ def index_document(slug: str, content: str) -> int:
 
     for i, chunk in enumerate(chunks):
         chunk_id = f"{slug}_{i}"
+        if chunk_id in present:
+            continue
         ids.append(chunk_id)
         documents.append(chunk.content)
         metadata = {
@@ -303,11 +730,25 @@ def index_document(slug: str, content: str) -> int:
             metadata["heading"] = chunk.name
         metadatas.append(metadata)
 
-    collection.upsert(
-        ids=ids,
-        documents=documents,
-        metadatas=metadatas,
-    )
+    for start in range(0, len(ids), UPSERT_BATCH_SIZE):
+        end = start + UPSERT_BATCH_SIZE
+        try:
+            collection.upsert(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Indexed {start} of {len(ids)} chunk(s) for '{slug}' before failing: {e}"
+            ) from e
+
+    if len(previous) > len(chunks):
+        collection.delete(
+            ids=[f"{slug}_{i}" for i in range(len(chunks), len(previous))]
+        )
+
+    _set_chunk_hashes(slug, current)
 
     return len(chunks)
 
@@ -315,9 +756,20 @@ def index_document(slug: str, content: str) -> int:
 def delete_doc_from_index(slug: str) -> int:
     """Delete all chunks for a document from ChromaDB.
 
+    Chunk ids are deterministic (``{slug}_{i}``), so when the chunks recorded
+    at index time are known they are deleted directly. Otherwise the
+    collection is scanned by ``doc_slug`` metadata.
+
     Returns the number of chunks deleted.
     """
     collection = get_collection()
+    chunk_hashes = _get_chunk_hashes(slug)
+
+    if chunk_hashes is not None:
+        count = len(chunk_hashes)
+        collection.delete(ids=[f"{slug}_{i}" for i in range(count)])
+        _delete_chunk_hashes(slug)
+        return count
 
     results = collection.get(
         where={"doc_slug": slug},
@@ -359,23 +811,25 @@ def search_docs(
         include=["documents", "metadatas", "distances"],
     )
 
+    ids = results["ids"][0] if results["ids"] else []
+    if not ids:
+        return []
+
+    documents = results["documents"][0] if results["documents"] else [""] * len(ids)
+    metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(ids)
+    distances = results["distances"][0] if results["distances"] else [0.0] * len(ids)
+
     search_results = []
-    if results["ids"] and results["ids"][0]:
-        for i, chunk_id in enumerate(results["ids"][0]):
-            result = {
-                "content": results["documents"][0][i] if results["documents"] else "",
-                "doc_slug": results["metadatas"][0][i].get("doc_slug", "")
-                if results["metadatas"]
-                else "",
-                "chunk_index": results["metadatas"][0][i].get("chunk_index", 0)
-                if results["metadatas"]
-                else 0,
-                "heading": results["metadatas"][0][i].get("heading", "")
-                if results["metadatas"]
-                else "",
-                "distance": results["distances"][0][i] if results["distances"] else 0.0,
+    for content, metadata, distance in zip(documents, metadatas, distances):
+        search_results.append(
+            {
+                "content": content,
+                "doc_slug": metadata.get("doc_slug", ""),
+                "chunk_index": metadata.get("chunk_index", 0),
+                "heading": metadata.get("heading", ""),
+                "distance": distance,
             }
-            search_results.append(result)
+        )
 
     return search_results
 
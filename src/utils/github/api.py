@@ -2,13 +2,53 @@
 GitHub API utilities for labels, issues, and pull requests.
 """
 
+import itertools
 import re
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from github import GithubException, Issue, PullRequest, Repository
 
 from src.utils.github.exceptions import GitHubError
 
+# Any host, so GitHub Enterprise PR URLs resolve too
+_PR_URL_RE = re.compile(r"/pull/(\d+)(?:[/?#]|$)")
+_CLOSES_RE = re.compile(r"Closes\s+#(\d+)", re.IGNORECASE)
+
+# Pull requests fetched by URL in this process, keyed by (repo full name, number)
+_pr_cache: Dict[tuple[str, int], PullRequest.PullRequest] = {}
+
+
+# Issues fetched or listed in this process, keyed by (repo full name, number)
+_issue_cache: Dict[tuple[str, int], Issue.Issue] = {}
+
+
+def clear_pull_request_cache() -> None:
+    """Forget pull requests cached by get_pull_request_by_url."""
+    _pr_cache.clear()
+
+
+def clear_issue_cache() -> None:
+    """Forget issues cached by the issue helpers."""
+    _issue_cache.clear()
+
+
+def _get_issue(
+    repo: Repository.Repository, issue: Union[int, Issue.Issue]
+) -> Issue.Issue:
+    """Return the given Issue, or fetch it by number (once per process)."""
+    if isinstance(issue, Issue.Issue):
+        return issue
+    key = (repo.full_name, issue)
+    cached = _issue_cache.get(key)
+    if cached is None:
+        cached = _issue_cache[key] = repo.get_issue(number=issue)
+    return cached
+
+
+def _issue_number(issue: Union[int, Issue.Issue]) -> int:
+    return issue.number if isinstance(issue, Issue.Issue) else issue
+
 
 def ensure_label(
     repo: Repository.Repository, name: str, color: str, description: str = ""
@@ -29,7 +69,8 @@ def ensure_label(
             try:
                 repo.create_label(name, color, description)
             except GithubException as ce:
-                raise GitHubError(f"Failed to create label '{name}': {ce}")
+                if ce.status != 422:
+                    raise GitHubError(f"Failed to create label '{name}': {ce}")
         else:
             raise GitHubError(f"Failed to check for label '{name}': {e}")
 
@@ -96,17 +137,22 @@ def get_issue_by_id(repo: Repository.Repository, issue_id: int) -> Issue.Issue:
         issue_id: The issue number
     """
     try:
-        return repo.get_issue(number=issue_id)
+        return _get_issue(repo, issue_id)
     except GithubException as e:
         raise GitHubError(f"Failed to retrieve issue #{issue_id}: {e}")
 
 
-def list_repo_issues(
-    repo: Repository.Repository, labels: Optional[List[str]] = None, state: str = "open"
-) -> List[Issue.Issue]:
+def iter_repo_issues(
+    repo: Repository.Repository,
+    labels: Optional[List[str]] = None,
+    state: str = "open",
+) -> Iterator[Issue.Issue]:
     """
-    List issues in the repository, optionally filtered by labels and state.
-    Excludes pull requests (which GitHub's API returns as issues).
+    Iterate over issues in the repository, newest first, excluding pull requests.
+
+    Pages are fetched as the iteration reaches them, so stopping early saves
+    the remaining requests. To count issues, use repo.get_issues().totalCount
+    rather than consuming this.
 
     Args:
         repo: PyGithub Repository instance
@@ -115,84 +161,157 @@ def list_repo_issues(
     """
     try:
         if labels:
-            issues = repo.get_issues(state=state, labels=labels)
+            issues = repo.get_issues(
+                state=state, labels=labels, sort="created", direction="desc"
+            )
         else:
-            issues = repo.get_issues(state=state)
-        # Filter out pull requests (they have a pull_request attribute)
-        return [issue for issue in issues if issue.pull_request is None]
+            issues = repo.get_issues(state=state, sort="created", direction="desc")
+        for issue in issues:
+            # Filter out pull requests (they have a pull_request attribute). Read
+            # the listed JSON directly: on a plain issue the attribute is unset,
+            # and accessing issue.pull_request would fetch the whole issue again.
+            if issue._rawData.get("pull_request"):
+                continue
+            # Let later per-issue helpers reuse the listed issue
+            _issue_cache[(repo.full_name, issue.number)] = issue
+            yield issue
     except GithubException as e:
         raise GitHubError(f"Failed to list issues: {e}")
 
 
-def get_comments(issue: Issue.Issue) -> List[Dict[str, Any]]:
+def list_repo_issues(
+    repo: Repository.Repository,
+    labels: Optional[List[str]] = None,
+    state: str = "open",
+    limit: Optional[int] = None,
+) -> List[Issue.Issue]:
     """
-    Get all comments for an issue, formatted for local storage.
+    List issues in the repository, optionally filtered by labels and state.
+    Excludes pull requests (which GitHub's API returns as issues).
+
+    Issues are returned newest first. With a limit, pages stop being fetched
+    once enough issues have been collected, so pass labels where possible to
+    narrow the listing server-side.
+
+    Args:
+        repo: PyGithub Repository instance
+        labels: List of label names to filter by
+        state: 'open', 'closed', or 'all'
+        limit: Maximum number of issues to return (optional)
+    """
+    return list(itertools.islice(iter_repo_issues(repo, labels, state), limit))
+
+
+def iter_comments(issue: Issue.Issue) -> Iterator[Dict[str, Any]]:
+    """
+    Yield comments for an issue one at a time, formatted for local storage.
+
+    Comment pages are only fetched as the iterator advances, so callers that
+    stop early avoid paging through long discussions.
 
     Args:
         issue: PyGithub Issue instance
 
-    Returns:
-        List of dicts containing comment info
+    Yields:
+        Dicts containing comment info
     """
     try:
-        comments = issue.get_comments()
-        return [
-            {
+        for comment in issue.get_comments():
+            yield {
                 "user": comment.user.login,
                 "body": comment.body,
                 "created_at": comment.created_at.isoformat(),
             }
-            for comment in comments
-        ]
     except GithubException as e:
         raise GitHubError(f"Failed to retrieve comments for issue #{issue.number}: {e}")
 
 
+def get_comments(issue: Issue.Issue) -> List[Dict[str, Any]]:
+    """
+    Get all comments for an issue, formatted for local storage.
+
+    Args:
+        issue: PyGithub Issue instance
+
+    Returns:
+        List of dicts containing comment info
+    """
+    return list(iter_comments(issue))
+
+
 # Status label configuration
-# Maps spec status to GitHub label name and color
-STATUS_LABELS = {
-    "todo": {
-        "label": "mem-status:todo",
-        "color": "6B7280",
-        "description": "Spec not yet started",
-    },
-    "active": {
-        "label": "mem-status:active",
-        "color": "22C55E",
-        "description": "Spec currently being worked on",
-    },
-    "inactive": {
-        "label": "mem-status:inactive",
-        "color": "EAB308",
-        "description": "Spec paused",
-    },
-    "completed": {
-        "label": "mem-status:completed",
-        "color": "3B82F6",
-        "description": "Spec completed",
-    },
-    "merge_ready": {
-        "label": "mem-status:merge-ready",
-        "color": "8B5CF6",
-        "description": "Spec ready to merge",
-    },
-    "archived": {
-        "label": "mem-status:archived",
-        "color": "374151",
-        "description": "Spec archived",
-    },
-}
+# Maps spec status to GitHub label name and color. Read-only at both levels,
+# since the reverse lookups below are derived from it at import time.
+STATUS_LABELS = MappingProxyType(
+    {
+        status: MappingProxyType(config)
+        for status, config in {
+            "todo": {
+                "label": "mem-status:todo",
+                "color": "6B7280",
+                "description": "Spec not yet started",
+            },
+            "active": {
+                "label": "mem-status:active",
+                "color": "22C55E",
+                "description": "Spec currently being worked on",
+            },
+            "inactive": {
+                "label": "mem-status:inactive",
+                "color": "EAB308",
+                "description": "Spec paused",
+            },
+            "completed": {
+                "label": "mem-status:completed",
+                "color": "3B82F6",
+                "description": "Spec completed",
+            },
+            "merge_ready": {
+                "label": "mem-status:merge-ready",
+                "color": "8B5CF6",
+                "description": "Spec ready to merge",
+            },
+            "archived": {
+                "label": "mem-status:archived",
+                "color": "374151",
+                "description": "Spec archived",
+            },
+        }.items()
+    }
+)
+
+
+# Reverse lookup: GitHub label name -> spec status
+_LABEL_TO_STATUS = {config["label"]: status for status, config in STATUS_LABELS.items()}
+_STATUS_LABEL_NAMES = frozenset(_LABEL_TO_STATUS)
+# Forward lookup: spec status -> GitHub label name
+_STATUS_TO_LABEL = {status: label for label, status in _LABEL_TO_STATUS.items()}
 
 
 def ensure_status_labels(repo: Repository.Repository) -> None:
     """
     Create all mem-status:* labels if they don't exist.
 
+    Lists the repository labels once and only creates the missing ones, so
+    the common case where every label already exists costs a single request.
+
     Args:
         repo: PyGithub Repository instance
     """
-    for status, config in STATUS_LABELS.items():
-        ensure_label(repo, config["label"], config["color"], config["description"])
+    try:
+        existing = {label.name for label in repo.get_labels()}
+    except GithubException as e:
+        raise GitHubError(f"Failed to list labels: {e}")
+
+    for config in STATUS_LABELS.values():
+        if config["label"] in existing:
+            continue
+        try:
+            repo.create_label(config["label"], config["color"], config["description"])
+        except GithubException as e:
+            # 422: created by someone else since we listed the labels
+            if e.status != 422:
+                raise GitHubError(f"Failed to create label '{config['label']}': {e}")
 
 
 def get_status_label_name(status: str) -> Optional[str]:
@@ -205,9 +324,7 @@ def get_status_label_name(status: str) -> Optional[str]:
     Returns:
         The label name (e.g., 'mem-status:active') or None if status is unknown
     """
-    if status in STATUS_LABELS:
-        return STATUS_LABELS[status]["label"]
-    return None
+    return _STATUS_TO_LABEL.get(status)
 
 
 def get_status_from_labels(labels: List[str]) -> Optional[str]:
@@ -220,21 +337,16 @@ def get_status_from_labels(labels: List[str]) -> Optional[str]:
     Returns:
         The spec status (e.g., 'active') or None if no status label found
     """
-    # Build reverse mapping: label -> status
-    label_to_status = {
-        config["label"]: status for status, config in STATUS_LABELS.items()
-    }
-
     for label in labels:
-        if label in label_to_status:
-            return label_to_status[label]
-
+        status = _LABEL_TO_STATUS.get(label)
+        if status:
+            return status
     return None
 
 
 def update_github_issue(
     repo: Repository.Repository,
-    issue_number: int,
+    issue_number: Union[int, Issue.Issue],
     title: Optional[str] = None,
     body: Optional[str] = None,
     state: Optional[str] = None,
@@ -246,7 +358,7 @@ def update_github_issue(
 
     Args:
         repo: PyGithub Repository instance
-        issue_number: The issue number to update
+        issue_number: The issue number to update, or the already-fetched Issue
         title: New title (optional)
         body: New body content (optional)
         state: New state - 'open' or 'closed' (optional)
@@ -257,7 +369,7 @@ def update_github_issue(
         The updated Issue instance
     """
     try:
-        issue = repo.get_issue(number=issue_number)
+        issue = _get_issue(repo, issue_number)
 
         # Build kwargs for edit() - only include non-None values
         edit_kwargs: Dict[str, Any] = {}
@@ -277,13 +389,16 @@ def update_github_issue(
 
         return issue
     except GithubException as e:
-        raise GitHubError(f"Failed to update issue #{issue_number}: {e}")
+        raise GitHubError(
+            f"Failed to update issue #{_issue_number(issue_number)}: {e}"
+        )
 
 
 def sync_status_labels(
     repo: Repository.Repository,
-    issue_number: int,
+    issue_number: Union[int, Issue.Issue],
     new_status: str,
+    current_labels: Optional[List[str]] = None,
 ) -> None:
     """
     Synchronize status labels on a GitHub issue.
@@ -292,18 +407,20 @@ def sync_status_labels(
 
     Args:
         repo: PyGithub Repository instance
-        issue_number: The issue number to update
+        issue_number: The issue number to update, or the already-fetched Issue
         new_status: The new spec status (e.g., 'active', 'completed')
+        current_labels: Label names already known to be on the issue (optional)
     """
     try:
-        issue = repo.get_issue(number=issue_number)
+        issue = _get_issue(repo, issue_number)
 
         # Get current labels
-        current_labels = [label.name for label in issue.labels]
+        if current_labels is None:
+            current_labels = [label.name for label in issue.labels]
 
         # Remove all existing mem-status:* labels
         new_labels = [
-            label for label in current_labels if not label.startswith("mem-status:")
+            label for label in current_labels if label not in _STATUS_LABEL_NAMES
         ]
 
         # Add the new status label
@@ -316,13 +433,14 @@ def sync_status_labels(
 
     except GithubException as e:
         raise GitHubError(
-            f"Failed to sync status labels for issue #{issue_number}: {e}"
+            f"Failed to sync status labels for issue "
+            f"#{_issue_number(issue_number)}: {e}"
         )
 
 
 def close_issue_with_comment(
     repo: Repository.Repository,
-    issue_number: int,
+    issue_number: Union[int, Issue.Issue],
     comment: str,
 ) -> Issue.Issue:
     """
@@ -330,36 +448,154 @@ def close_issue_with_comment(
 
     Args:
         repo: PyGithub Repository instance
-        issue_number: The issue number to close
+        issue_number: The issue number to close, or the already-fetched Issue
         comment: Comment to add before closing
 
     Returns:
         The closed Issue instance
     """
     try:
-        issue = repo.get_issue(number=issue_number)
+        issue = _get_issue(repo, issue_number)
         issue.create_comment(comment)
         issue.edit(state="closed")
         return issue
     except GithubException as e:
-        raise GitHubError(f"Failed to close issue #{issue_number}: {e}")
+        raise GitHubError(f"Failed to close issue #{_issue_number(issue_number)}: {e}")
+
+
+_MERGE_READY_PRS_QUERY = """
+query($owner: String!, $name: String!, $base: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, baseRefName: $base, first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        body
+        url
+        headRefName
+        mergeable
+        author { login }
+        commits(last: 1) { nodes { commit { statusCheckRollup { state } } } }
+      }
+    }
+  }
+}
+"""
 
+# GraphQL MergeableState -> REST-style mergeable flag
+_GRAPHQL_MERGEABLE = {"MERGEABLE": True, "CONFLICTING": False}
 
-def list_merge_ready_prs(
+
+def _extract_closes_issue(body: Optional[str]) -> Optional[int]:
+    """Return the issue number from a "Closes #X" line in a PR body, if any."""
+    if not body:
+        return None
+    match = _CLOSES_RE.search(body)
+    return int(match.group(1)) if match else None
+
+
+def _clean_complete_title(title: str) -> str:
+    """Strip the [Complete]: prefix from a PR title for display."""
+    if title.startswith("[Complete]:"):
+        return title.removeprefix("[Complete]:").strip()
+    # Marker moved elsewhere in the title by hand
+    return title.replace("[Complete]:", "").strip()
+
+
+def _iter_merge_ready_prs_graphql(
+    repo: Repository.Repository, base_branch: str
+) -> Iterator[Dict[str, Any]]:
+    """Yield merge-ready PRs with their check rollup, one GraphQL query per 100 PRs."""
+    owner, name = repo.full_name.split("/", 1)
+    variables: Dict[str, Any] = {
+        "owner": owner,
+        "name": name,
+        "base": base_branch,
+        "cursor": None,
+    }
+
+    while True:
+        _, data = repo.requester.graphql_query(_MERGE_READY_PRS_QUERY, variables)
+        pulls = data["data"]["repository"]["pullRequests"]
+
+        for node in pulls["nodes"]:
+            if "[Complete]:" not in node["title"]:
+                continue
+
+            checks_passing = None
+            commits = node["commits"]["nodes"]
+            rollup = commits[0]["commit"]["statusCheckRollup"] if commits else None
+            if rollup:
+                checks_passing = rollup["state"] == "SUCCESS"
+
+            yield {
+                "number": node["number"],
+                "title": _clean_complete_title(node["title"]),
+                "author": (node["author"] or {}).get("login", "ghost"),
+                "issue_number": _extract_closes_issue(node["body"]),
+                "checks_passing": checks_passing,
+                "mergeable": _GRAPHQL_MERGEABLE.get(node["mergeable"]),
+                "html_url": node["url"],
+                "head_branch": node["headRefName"],
+            }
+
+        if not pulls["pageInfo"]["hasNextPage"]:
+            return
+        variables["cursor"] = pulls["pageInfo"]["endCursor"]
+
+
+def _iter_merge_ready_prs_rest(
+    repo: Repository.Repository, base_branch: str
+) -> Iterator[Dict[str, Any]]:
+    """Yield merge-ready PRs over REST, with one status request per PR."""
+    pulls = repo.get_pulls(state="open", base=base_branch)
+
+    for pr in pulls:
+        # Only include PRs with [Complete]: in title
+        if "[Complete]:" not in pr.title:
+            continue
+
+        # Check if checks are passing. Request the combined status directly;
+        # going through repo.get_commit() would fetch the commit first.
+        checks_passing = None
+        try:
+            _, status = repo.requester.requestJsonAndCheck(
+                "GET", f"{repo.url}/commits/{pr.head.sha}/status"
+            )
+            if status["total_count"] > 0:
+                checks_passing = status["state"] == "success"
+        except GithubException:
+            pass
+
+        yield {
+            "number": pr.number,
+            "title": _clean_complete_title(pr.title),
+            "author": pr.user.login,
+            "issue_number": _extract_closes_issue(pr.body),
+            "checks_passing": checks_passing,
+            "mergeable": pr.mergeable,
+            "html_url": pr.html_url,
+            "head_branch": pr.head.ref,
+        }
+
+
+def iter_merge_ready_prs(
     repo: Repository.Repository,
     base_branch: str = "dev",
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
-    List open PRs targeting base_branch that are ready to merge.
+    Iterate over open PRs targeting base_branch that are ready to merge.
 
-    Looks for PRs with "[Complete]:" in the title (our convention from mem spec complete).
+    Pages are fetched as the iteration reaches them, so stopping early saves
+    the remaining requests.
 
     Args:
         repo: PyGithub Repository instance
         base_branch: The branch PRs should target (default: dev)
 
-    Returns:
-        List of dicts with PR info:
+    Yields:
+        Dicts with PR info:
             - number: PR number
             - title: PR title (with [Complete]: prefix stripped)
             - author: GitHub username
@@ -369,53 +605,42 @@ def list_merge_ready_prs(
             - html_url: Link to PR
             - head_branch: Branch name to delete after merge
     """
+    yielded = False
     try:
-        pulls = repo.get_pulls(state="open", base=base_branch)
-        result = []
+        for pr in _iter_merge_ready_prs_graphql(repo, base_branch):
+            yielded = True
+            yield pr
+        return
+    except (GithubException, KeyError, TypeError) as e:
+        # Falling back part way through would repeat PRs already yielded
+        if yielded:
+            raise GitHubError(f"Failed to list pull requests: {e}")
 
-        for pr in pulls:
-            # Only include PRs with [Complete]: in title
-            if "[Complete]:" not in pr.title:
-                continue
+    try:
+        yield from _iter_merge_ready_prs_rest(repo, base_branch)
+    except GithubException as e:
+        raise GitHubError(f"Failed to list pull requests: {e}")
 
-            # Extract issue number from body (look for "Closes #X")
-            issue_number = None
-            if pr.body:
-                match = re.search(r"Closes\s+#(\d+)", pr.body, re.IGNORECASE)
-                if match:
-                    issue_number = int(match.group(1))
 
-            # Check if checks are passing
-            checks_passing = None
-            try:
-                commit = repo.get_commit(pr.head.sha)
-                combined_status = commit.get_combined_status()
-                if combined_status.total_count > 0:
-                    checks_passing = combined_status.state == "success"
-            except GithubException:
-                pass
-
-            # Clean title for display
-            display_title = (
-                pr.title.replace("[Complete]:", "").replace("[Complete]: ", "").strip()
-            )
+def list_merge_ready_prs(
+    repo: Repository.Repository,
+    base_branch: str = "dev",
+) -> List[Dict[str, Any]]:
+    """
+    List open PRs targeting base_branch that are ready to merge.
 
-            result.append(
-                {
-                    "number": pr.number,
-                    "title": display_title,
-                    "author": pr.user.login,
-                    "issue_number": issue_number,
-                    "checks_passing": checks_passing,
-                    "mergeable": pr.mergeable,
-                    "html_url": pr.html_url,
-                    "head_branch": pr.head.ref,
-                }
-            )
+    Looks for PRs with "[Complete]:" in the title (our convention from mem spec complete).
+    Fetches PRs and their check status in a single GraphQL query, falling back
+    to per-PR REST calls if GraphQL is unavailable.
 
-        return result
-    except GithubException as e:
-        raise GitHubError(f"Failed to list pull requests: {e}")
+    Args:
+        repo: PyGithub Repository instance
+        base_branch: The branch PRs should target (default: dev)
+
+    Returns:
+        List of dicts as yielded by iter_merge_ready_prs
+    """
+    return list(iter_merge_ready_prs(repo, base_branch))
 
 
 def get_pull_request_by_url(
@@ -431,15 +656,27 @@ def get_pull_request_by_url(
 
     Returns:
         The PullRequest instance or None if not found
+
+    Results are cached per repository and PR number for the rest of the
+    process; merge_pull_request and close_pull_request drop their entry.
     """
+    # URL format: https://<host>/owner/repo/pull/123, possibly followed by a
+    # sub-page, query string or fragment
+    match = _PR_URL_RE.search(pr_url)
+    if not match:
+        return None
+
+    key = (repo.full_name, int(match.group(1)))
+    pr = _pr_cache.get(key)
+    if pr is not None:
+        return pr
+
     try:
-        # Extract PR number from URL
-        # URL format: https://github.com/owner/repo/pull/123
-        parts = pr_url.rstrip("/").split("/")
-        pr_number = int(parts[-1])
-        return repo.get_pull(pr_number)
-    except (ValueError, IndexError, GithubException):
+        pr = repo.get_pull(key[1])
+    except GithubException:
         return None
+    _pr_cache[key] = pr
+    return pr
 
 
 def is_pr_merged(
@@ -519,6 +756,7 @@ def merge_pull_request(
             - sha: str | None - merge commit SHA if successful
             - message: str - success/error message
     """
+    _pr_cache.pop((pr.base.repo.full_name, pr.number), None)
     try:
         if commit_message:
             result = pr.merge(merge_method=merge_method, commit_message=commit_message)
@@ -581,6 +819,7 @@ def close_pull_request(
         if pr is None:
             return False
 
+        _pr_cache.pop((repo.full_name, pr.number), None)
         if pr.state == "closed":
             return True
 
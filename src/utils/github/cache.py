@@ -0,0 +1,217 @@
+"""
+Conditional-request (ETag) cache for GitHub REST responses.
+
+GET responses are stored in SQLite together with their ETag/Last-Modified
+validators. Repeat requests send If-None-Match/If-Modified-Since, and a 304
+reply, which does not count against the rate limit, is answered from the
+stored body.
+
+The same requester also pauses when the primary rate limit is nearly used
+up, rather than letting a bulk operation run into 403s part way through.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from github import Github
+from github.Requester import Requester
+
+from env_settings import ENV_SETTINGS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    fetched_at INTEGER NOT NULL
+)
+"""
+
+# Pause once fewer than this many requests remain in the rate-limit window...
+RATE_LIMIT_RESERVE = 50
+# ...unless the window resets further out than this (seconds); PyGithub's
+# retry handling then reports the exhausted limit instead of hanging.
+MAX_RATE_LIMIT_WAIT = 300
+
+_caches: dict[Path, "EtagCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class CachedResponse(NamedTuple):
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, Any]
+    body: str
+
+
+class EtagCache:
+    """SQLite-backed store of GET responses keyed by request URL."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE url = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, headers, body = row
+        return CachedResponse(etag, last_modified, json.loads(headers), body)
+
+    def put(self, key: str, headers: dict[str, Any], body: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, headers, body, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                    json.dumps(headers),
+                    body,
+                    int(time.time()),
+                ),
+            )
+
+
+def _cache_key(
+    url: str, parameters: dict[str, Any] | None, headers: dict[str, Any] | None
+) -> str:
+    """Key a GET by its full URL plus any caller-supplied headers (e.g. Accept)."""
+    key = Requester.add_parameters_to_url(url, parameters or {})
+    if headers:
+        key += " " + json.dumps(sorted(headers.items()))
+    return key
+
+
+def _wait_for_rate_limit(response_headers: dict[str, Any]) -> None:
+    """Sleep until the rate-limit window resets if the remaining quota is low."""
+    try:
+        remaining = int(float(response_headers["x-ratelimit-remaining"]))
+        reset_at = float(response_headers["x-ratelimit-reset"])
+    except (KeyError, ValueError):
+        return
+    if remaining >= RATE_LIMIT_RESERVE:
+        return
+    wait = reset_at - time.time() + 1
+    if 0 < wait <= MAX_RATE_LIMIT_WAIT:
+        time.sleep(wait)
+
+
+class CachingRequester(Requester):
+    """PyGithub Requester that revalidates GETs against an EtagCache.
+
+    Request spacing and retries on 403/429 come from PyGithub itself
+    (seconds_between_requests/writes and GithubRetry); this class adds the
+    pause before the primary rate limit runs out.
+    """
+
+    def __init__(self, *args: Any, etag_cache: EtagCache, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._etag_cache = etag_cache
+
+    def _with_cache(self, requester: Requester) -> Requester:
+        if requester is self or isinstance(requester, CachingRequester):
+            return requester
+        return CachingRequester(**requester.kwargs, etag_cache=self._etag_cache)
+
+    def withAuth(self, auth: Any) -> Requester:
+        return self._with_cache(super().withAuth(auth))
+
+    def withLazy(self, lazy: Any) -> Requester:
+        return self._with_cache(super().withLazy(lazy))
+
+    def withApiVersion(self, api_version: str | None) -> Requester:
+        return self._with_cache(super().withApiVersion(api_version))
+
+    def requestJson(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        input: Any | None = None,
+        cnx: Any = None,
+        follow_302_redirect: bool = False,
+    ) -> tuple[int, dict[str, Any], str]:
+        if verb != "GET":
+            status, response_headers, output = super().requestJson(
+                verb, url, parameters, headers, input, cnx, follow_302_redirect
+            )
+            _wait_for_rate_limit(response_headers)
+            return status, response_headers, output
+
+        key = _cache_key(url, parameters, headers)
+        cached = self._etag_cache.get(key)
+
+        # Copy so the auth header PyGithub adds never leaks into the caller's dict
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        status, response_headers, output = super().requestJson(
+            verb, url, parameters, request_headers, input, cnx, follow_302_redirect
+        )
+        _wait_for_rate_limit(response_headers)
+
+        if status == 304 and cached is not None:
+            return 200, {**cached.headers, **response_headers}, cached.body
+        if status == 200 and (
+            "etag" in response_headers or "last-modified" in response_headers
+        ):
+            self._etag_cache.put(key, response_headers, output)
+        return status, response_headers, output
+
+
+def get_etag_cache(path: Path | None = None) -> EtagCache:
+    """Get the shared EtagCache for a path (default: ~/.cache/mem/gh_etag.sqlite)."""
+    path = path or ENV_SETTINGS.cache_dir / "gh_etag.sqlite"
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = EtagCache(path)
+            _caches[path] = cache
+        return cache
+
+
+def enable_etag_cache(client: Github, path: Path | None = None) -> Github:
+    """
+    Route a client's requests through a CachingRequester.
+
+    Must be called before the client creates any objects, since those keep a
+    reference to the requester they were created with. If the cache file
+    cannot be opened the client is returned unchanged.
+
+    Args:
+        client: Freshly constructed Github client
+        path: Cache file location (optional)
+
+    Returns:
+        The same client
+    """
+    try:
+        cache = get_etag_cache(path)
+    except (OSError, sqlite3.Error):
+        return client
+
+    requester = CachingRequester(**client.requester.kwargs, etag_cache=cache)
+    client._Github__requester = requester  # type: ignore[attr-defined]
+    return client
@@ -3,11 +3,25 @@ GitHub client and authentication utilities.
 """
 
 import os
+import weakref
 
-from github import Auth, Github, GithubException
+from github import Auth, Github, GithubException, GithubRetry
+from github.AuthenticatedUser import AuthenticatedUser
 
+from src.utils.github.cache import enable_etag_cache
 from src.utils.github.exceptions import GitHubAuthenticationError
 
+# Minimum spacing between API calls, enforced by PyGithub's Requester
+SECONDS_BETWEEN_REQUESTS = 0.25
+SECONDS_BETWEEN_WRITES = 1.0
+# Items per page for paginated listings (GitHub's maximum; its default is 30)
+PER_PAGE = 100
+
+# User fetched while validating each client, so it is only requested once
+_authenticated_users: "weakref.WeakKeyDictionary[Github, AuthenticatedUser]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def get_github_token() -> str:
     """
@@ -45,9 +59,19 @@ def get_github_client() -> Github:
     try:
         token = get_github_token()
         auth = Auth.Token(token)
-        g = Github(auth=auth)
+        g = enable_etag_cache(
+            Github(
+                auth=auth,
+                retry=GithubRetry(total=5, backoff_factor=1),
+                per_page=PER_PAGE,
+                seconds_between_requests=SECONDS_BETWEEN_REQUESTS,
+                seconds_between_writes=SECONDS_BETWEEN_WRITES,
+            )
+        )
         # Test authentication by getting user login
-        g.get_user().login
+        user = g.get_user()
+        user.login
+        _authenticated_users[g] = user
         return g
     except GithubException as e:
         raise GitHubAuthenticationError(f"GitHub authentication failed: {e}")
@@ -61,6 +85,8 @@ def get_authenticated_user(client: Github) -> dict:
     """
     Get authenticated user information from GitHub.
 
+    Reuses the user fetched when the client was validated, if any.
+
     Args:
         client: Authenticated Github client
 
@@ -75,7 +101,10 @@ def get_authenticated_user(client: Github) -> dict:
         GitHubAuthenticationError: If user info retrieval fails
     """
     try:
-        user = client.get_user()
+        user = _authenticated_users.get(client)
+        if user is None:
+            user = client.get_user()
+            _authenticated_users[client] = user
         return {
             "username": user.login,
             "name": user.name or user.login,
@@ -8,6 +8,7 @@ from typing import List, Optional
 from git import Repo
 
 from src.utils.github.exceptions import GitHubError, GitRepositoryNotFoundError
+from src.utils.github.repo import get_git_repo
 
 
 def ensure_branches_exist(
@@ -16,6 +17,7 @@ def ensure_branches_exist(
     """
     Ensure specified branches exist both locally and on remote.
     Creates them from current HEAD and pushes to origin if they don't exist.
+    Only fetches from origin when a branch is missing locally or remotely.
 
     Args:
         repo_path: Path to git repository
@@ -29,35 +31,50 @@ def ensure_branches_exist(
         branches = ["main", "test", "dev"]
 
     try:
-        repo = Repo(repo_path)
+        repo = get_git_repo(repo_path)
         if repo.bare:
             raise GitRepositoryNotFoundError(f"Bare repository found at {repo_path}")
 
         origin = repo.remote("origin")
 
+        local_heads = {h.name for h in repo.heads}
+        remote_refs = {ref.name for ref in origin.refs}
+
+        # Nothing to do if every branch is already present and tracked
+        if all(
+            branch_name in local_heads and f"origin/{branch_name}" in remote_refs
+            for branch_name in branches
+        ):
+            return
+
         # Fetch to get latest remote state
         origin.fetch()
+        remote_refs = {ref.name for ref in origin.refs}
 
         for branch_name in branches:
             # Check if branch exists locally
-            local_exists = branch_name in [h.name for h in repo.heads]
+            local_exists = branch_name in local_heads
 
             # Check if branch exists on remote
-            remote_exists = f"origin/{branch_name}" in [ref.name for ref in origin.refs]
+            remote_exists = f"origin/{branch_name}" in remote_refs
 
             if not local_exists and not remote_exists:
                 # Create branch from current HEAD
                 branch = repo.create_head(branch_name)
+                local_heads.add(branch_name)
                 # Push to remote and set upstream
                 repo.git.push("origin", branch_name, set_upstream=True)
+                remote_refs.add(f"origin/{branch_name}")
             elif not local_exists and remote_exists:
                 # Create local tracking branch from remote
                 remote_ref = origin.refs[branch_name]
                 branch = repo.create_head(branch_name, remote_ref)
                 branch.set_tracking_branch(remote_ref)
+                local_heads.add(branch_name)
             elif local_exists and not remote_exists:
                 # Push existing local branch to remote
                 repo.git.push("origin", branch_name, set_upstream=True)
+                remote_refs.add(f"origin/{branch_name}")
             # else: both exist, nothing to do
 
     except GitRepositoryNotFoundError:
@@ -66,6 +83,11 @@ def ensure_branches_exist(
         raise GitHubError(f"Failed to ensure branches exist: {e}")
 
 
+def _is_current_branch(repo: Repo, branch_name: str) -> bool:
+    """Check HEAD without spawning git, so no-op switches can be skipped."""
+    return not repo.head.is_detached and repo.head.ref.name == branch_name
+
+
 def switch_to_branch(repo_path: Path, branch_name: str = "dev") -> None:
     """
     Switch to the specified branch.
@@ -79,8 +101,9 @@ def switch_to_branch(repo_path: Path, branch_name: str = "dev") -> None:
         GitRepositoryNotFoundError: If path is not a git repository
     """
     try:
-        repo = Repo(repo_path)
-        repo.git.switch(branch_name)
+        repo = get_git_repo(repo_path)
+        if not _is_current_branch(repo, branch_name):
+            repo.git.switch(branch_name)
     except Exception as e:
         raise GitHubError(f"Failed to switch to branch '{branch_name}': {e}")
 
@@ -101,34 +124,36 @@ def smart_switch(repo_path: Path, branch_name: str, base_branch: str = "dev") ->
         GitHubError: If git operations fail
     """
     try:
-        repo = Repo(repo_path)
+        repo = get_git_repo(repo_path)
+
+        # Check local first; an existing local branch needs no remote state
+        if any(h.name == branch_name for h in repo.heads):
+            if not _is_current_branch(repo, branch_name):
+                repo.git.switch(branch_name)
+            return False
+
         origin = repo.remote("origin")
         origin.fetch()
 
-        # Check local
-        local_exists = branch_name in [h.name for h in repo.heads]
         # Check remote
-        remote_exists = f"origin/{branch_name}" in [ref.name for ref in origin.refs]
-
-        if local_exists:
-            repo.git.switch(branch_name)
-            return False
-        elif remote_exists:
+        remote_name = f"origin/{branch_name}"
+        if any(ref.name == remote_name for ref in origin.refs):
             # Create local tracking branch from remote
             repo.git.switch("--track", f"origin/{branch_name}")
             return False
-        else:
-            # Create new from base
-            # First ensure base branch is checked out and updated
+
+        # Create new from base
+        # First ensure base branch is checked out and updated
+        if not _is_current_branch(repo, base_branch):
             repo.git.switch(base_branch)
-            try:
-                repo.git.pull("origin", base_branch)
-            except Exception:
-                # Best effort pull, continue if it fails
-                pass
-
-            repo.git.switch("-c", branch_name)
-            return True
+        try:
+            repo.git.pull("origin", base_branch)
+        except Exception:
+            # Best effort pull, continue if it fails
+            pass
+
+        repo.git.switch("-c", branch_name)
+        return True
     except Exception as e:
         raise GitHubError(f"Failed to switch to or create branch '{branch_name}': {e}")
 
@@ -138,7 +163,7 @@ def get_current_branch(repo_path: Path) -> str:
     Get the name of the currently active branch.
     """
     try:
-        repo = Repo(repo_path)
+        repo = get_git_repo(repo_path)
         return repo.active_branch.name
     except Exception as e:
         raise GitHubError(f"Failed to get current branch: {e}")
@@ -149,7 +174,7 @@ def push_branch(repo_path: Path, branch_name: str, set_upstream: bool = True) ->
     Push a branch to origin.
     """
     try:
-        repo = Repo(repo_path)
+        repo = get_git_repo(repo_path)
         args = ["origin", branch_name]
         if set_upstream:
             args.append("--set-upstream")
@@ -2,9 +2,11 @@
 GitHub repository discovery and parsing utilities.
 """
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from git import Repo
 from git.exc import InvalidGitRepositoryError
@@ -14,7 +16,48 @@ from src.utils.github.exceptions import (
     GitRepositoryNotFoundError,
 )
 
+# HTTPS format (including authenticated URLs)
+_HTTPS_GH_RE = re.compile(r"https://(?:[^@]+@)?github\.com/([^/]+)/([^/\.]+)")
+# SSH format
+_SSH_GH_RE = re.compile(r"git@github\.com:([^/]+)/([^/\.]+)")
 
+
+# GitHub (owner, repo) per git dir, keyed with the mtime of its config file
+_remote_repo_cache: Dict[Tuple[str, Optional[int]], Tuple[str, str]] = {}
+
+
+@lru_cache(maxsize=8)
+def _open_git_repo(resolved_path: Path, inode: int) -> Repo:
+    return Repo(resolved_path)
+
+
+def get_git_repo(repo_path: Path) -> Repo:
+    """
+    Get a GitPython Repo for a path, reusing the instance across calls.
+
+    Instances are keyed by resolved path and directory inode, so a repository
+    deleted and recreated at the same path gets a fresh Repo.
+
+    Args:
+        repo_path: Path to git repository
+
+    Returns:
+        Repo instance
+
+    Raises:
+        InvalidGitRepositoryError: If the path is not a git repository
+        NoSuchPathError: If the path does not exist
+    """
+    resolved = Path(repo_path).resolve()
+    try:
+        inode = os.stat(resolved).st_ino
+    except OSError:
+        # Let GitPython raise its usual error for the missing path
+        return Repo(resolved)
+    return _open_git_repo(resolved, inode)
+
+
+@lru_cache(maxsize=32)
 def parse_github_repo_url(url: str) -> Optional[Tuple[str, str]]:
     """
     Parse GitHub repository URL to extract owner and repo name.
@@ -32,17 +75,10 @@ def parse_github_repo_url(url: str) -> Optional[Tuple[str, str]]:
     Returns:
         Tuple of (owner, repo) or None if not a GitHub URL
     """
-    # HTTPS format (including authenticated URLs)
-    https_pattern = r"https://(?:[^@]+@)?github\.com/([^/]+)/([^/\.]+)"
-    match = re.match(https_pattern, url)
-    if match:
-        return match.group(1), match.group(2)
-
-    # SSH format
-    ssh_pattern = r"git@github\.com:([^/]+)/([^/\.]+)"
-    match = re.match(ssh_pattern, url)
-    if match:
-        return match.group(1), match.group(2)
+    for pattern in (_HTTPS_GH_RE, _SSH_GH_RE):
+        match = pattern.match(url)
+        if match:
+            return match.group(1), match.group(2)
 
     return None
 
@@ -60,12 +96,24 @@ def get_repo_from_git(repo_path: Path) -> Tuple[str, str]:
     Raises:
         GitRepositoryNotFoundError: If not a git repo
         GitHubRepositoryError: If no GitHub remote found
+
+    The result is cached until the repository's config file changes.
     """
     try:
-        repo = Repo(repo_path)
+        repo = get_git_repo(repo_path)
     except InvalidGitRepositoryError:
         raise GitRepositoryNotFoundError(f"Not a git repository: {repo_path}")
 
+    config_mtime: Optional[int] = None
+    try:
+        config_mtime = os.stat(os.path.join(repo.common_dir, "config")).st_mtime_ns
+    except OSError:
+        pass
+    cache_key = (repo.git_dir, config_mtime)
+    cached = _remote_repo_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     if not repo.remotes:
         raise GitHubRepositoryError("No git remotes configured")
 
@@ -85,6 +133,7 @@ def get_repo_from_git(repo_path: Path) -> Tuple[str, str]:
             f"mem requires a GitHub repository."
         )
 
+    _remote_repo_cache[cache_key] = parsed
     return parsed
 
 
@@ -106,12 +155,16 @@ def get_git_user_info(repo_path: Path) -> dict:
         GitHubRepositoryError: If git user not configured
     """
     try:
-        repo = Repo(repo_path)
+        repo = get_git_repo(repo_path)
         config = repo.config_reader()
 
         try:
-            name = config.get_value("user", "name")
-            email = config.get_value("user", "email")
+            # Read the whole [user] section in one pass (items() does not
+            # load the config files lazily the way get_value() does)
+            config.read()
+            user = dict(config.items("user"))
+            name = user["name"]
+            email = user["email"]
         except Exception:
             raise GitHubRepositoryError(
                 "Git user not configured.\n"
@@ -10,14 +10,22 @@ Each log has YAML frontmatter with metadata and markdown body.
 Multiple logs per day are supported.
 """
 
-import tomllib
-from datetime import datetime
+import functools
+import heapq
+import os
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Any
 
 from env_settings import ENV_SETTINGS
 from src.models import create_log_frontmatter
-from src.utils.markdown import read_md_file, slugify, write_md_file
+from src.utils.markdown import (
+    read_md_file,
+    read_md_header,
+    slugify,
+    update_md_frontmatter,
+    write_md_file,
+)
 
 
 def _get_template_dir() -> Path:
@@ -25,8 +33,9 @@ def _get_template_dir() -> Path:
     return Path(__file__).parent.parent / "templates"
 
 
+@functools.cache
 def _load_log_template() -> str:
-    """Load the log template file."""
+    """Load the log template file (read once per process)."""
     template_file = _get_template_dir() / "log.md"
     return template_file.read_text()
 
@@ -53,15 +62,17 @@ def _get_current_github_username() -> str:
 
     # Read user_mappings.toml and do reverse lookup (name -> github username)
     mappings_file = ENV_SETTINGS.mem_dir / "user_mappings.toml"
-    if mappings_file.exists():
+    try:
+        st = mappings_file.stat()
+    except OSError:
+        st = None
+    if st is not None:
         try:
-            with open(mappings_file, "rb") as f:
-                mappings = tomllib.load(f)
-
-            # Find the GitHub username that has this git name
-            for github_username, user_info in mappings.items():
-                if user_info.get("name") == git_name:
-                    return slugify(github_username)
+            usernames = _load_usernames_by_git_name(
+                mappings_file, st.st_mtime_ns, st.st_size
+            )
+            if git_name in usernames:
+                return usernames[git_name]
         except Exception:
             pass
 
@@ -69,6 +80,26 @@ def _get_current_github_username() -> str:
     return slugify(git_name)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_usernames_by_git_name(
+    mappings_file: Path, mtime_ns: int, size: int
+) -> dict[str, str]:
+    """Map git user names to slugified GitHub usernames from user_mappings.toml.
+
+    Cached per file version (mtime and size), so the TOML is parsed once.
+    """
+    import tomllib
+
+    with open(mappings_file, "rb") as f:
+        mappings = tomllib.load(f)
+
+    usernames: dict[str, str] = {}
+    for github_username, user_info in mappings.items():
+        # The first GitHub username listed for a git name wins
+        usernames.setdefault(user_info.get("name"), slugify(github_username))
+    return usernames
+
+
 def _get_log_filename(created_at: datetime, username: str | None = None) -> str:
     """Get log filename for a datetime and user."""
     if username is None:
@@ -76,9 +107,16 @@ def _get_log_filename(created_at: datetime, username: str | None = None) -> str:
     return f"{username}_{created_at.strftime('%Y%m%d')}_{created_at.strftime('%H%M%S')}_session.md"
 
 
-def _get_log_file(created_at: datetime, username: str | None = None) -> Path:
-    """Get path to a log file."""
-    return _get_logs_dir() / _get_log_filename(created_at, username)
+def _get_log_file(
+    created_at: datetime, username: str | None = None, logs_dir: Path | None = None
+) -> Path:
+    """Get path to a log file.
+
+    Pass logs_dir when the caller already has it to skip resolving it again.
+    """
+    if logs_dir is None:
+        logs_dir = _get_logs_dir()
+    return logs_dir / _get_log_filename(created_at, username)
 
 
 def _parse_log_filename(filename: str) -> tuple[str, datetime] | None:
@@ -92,48 +130,71 @@ def _parse_log_filename(filename: str) -> tuple[str, datetime] | None:
         return None
 
     # Remove suffix
-    base = filename.replace("_session.md", "")
-
-    # Try new format first: {username}_{YYYYMMDD}_{HHMMSS}
-    parts = base.rsplit("_", 2)
-    if len(parts) == 3:
-        username = parts[0]
-        date_str = parts[1]
-        time_str = parts[2]
+    base = filename.removesuffix("_session.md")
+
+    # Check the digit positions before handing anything to strptime, so names
+    # that merely end in _session.md are rejected without raising.
+    # New format first: {username}_{YYYYMMDD}_{HHMMSS}
+    if (
+        len(base) >= 16
+        and base[-16] == "_"
+        and base[-7] == "_"
+        and base[-15:-7].isdigit()
+        and base[-6:].isdigit()
+    ):
         try:
-            log_datetime = datetime.strptime(f"{date_str}_{time_str}", "%Y%m%d_%H%M%S")
-            return (username, log_datetime)
+            return (base[:-16], _datetime_from_digits(base[-15:-7], base[-6:]))
         except ValueError:
             pass
 
     # Fall back to legacy format: {username}_{YYYYMMDD}
-    parts = base.rsplit("_", 1)
-    if len(parts) == 2:
-        username = parts[0]
-        date_str = parts[1]
+    if len(base) >= 9 and base[-9] == "_" and base[-8:].isdigit():
         try:
-            log_datetime = datetime.strptime(date_str, "%Y%m%d")
-            return (username, log_datetime)
+            return (base[:-9], _datetime_from_digits(base[-8:]))
         except ValueError:
             pass
 
     return None
 
 
+def _datetime_from_digits(date_digits: str, time_digits: str = "000000") -> datetime:
+    """Build a datetime from YYYYMMDD and HHMMSS digit strings.
+
+    Equivalent to strptime with "%Y%m%d" / "%H%M%S" for already validated
+    digits, without parsing a format string per call.
+    Raises ValueError for out-of-range fields.
+    """
+    return datetime(
+        int(date_digits[0:4]),
+        int(date_digits[4:6]),
+        int(date_digits[6:8]),
+        int(time_digits[0:2]),
+        int(time_digits[2:4]),
+        int(time_digits[4:6]),
+    )
+
+
 def _log_to_dict(
     username: str, log_datetime: datetime, metadata: dict, body: str, filename: str
 ) -> dict[str, Any]:
     """Convert parsed log file to a dict."""
+    # isoformat() always starts with the zero-padded YYYY-MM-DD date
+    created_at = log_datetime.isoformat()
     return {
         "username": username,
-        "created_at": log_datetime.isoformat(),
-        "date": log_datetime.date().isoformat(),
+        "created_at": created_at,
+        "date": created_at[:10],
         "filename": filename,
         "body": body,
         **metadata,
     }
 
 
+def _log_created_at(log: dict[str, Any]) -> str:
+    """Sort key for logs: the created_at from their frontmatter."""
+    return log.get("created_at", "")
+
+
 def create_log(spec_slug: str | None = None) -> Path:
     """Create work log for the current user.
 
@@ -146,7 +207,7 @@ def create_log(spec_slug: str | None = None) -> Path:
 
     now = datetime.now()
     username = _get_current_github_username()
-    log_file = _get_log_file(now, username)
+    log_file = _get_log_file(now, username, logs_dir)
 
     frontmatter = create_log_frontmatter(now, username, spec_slug)
     body = _load_log_template()
@@ -157,17 +218,15 @@ def create_log(spec_slug: str | None = None) -> Path:
 
 def get_log_by_filename(filename: str) -> dict[str, Any] | None:
     """Get log by its filename."""
-    log_file = _get_logs_dir() / filename
-
-    if not log_file.exists():
-        return None
-
     parsed = _parse_log_filename(filename)
     if parsed is None:
         return None
 
     file_username, log_datetime = parsed
-    metadata, body = read_md_file(log_file)
+    try:
+        metadata, body = read_md_file(_get_logs_dir() / filename)
+    except FileNotFoundError:
+        return None
     return _log_to_dict(file_username, log_datetime, metadata, body, filename)
 
 
@@ -193,96 +252,146 @@ def list_logs(
     if not logs_dir.exists():
         return []
 
-    logs = []
-    for log_file in logs_dir.iterdir():
-        if not log_file.is_file() or not log_file.name.endswith("_session.md"):
-            continue
+    # Parse filenames first; only the newest candidates need to be read
+    candidates = []
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith("_session.md") or not entry.is_file():
+                continue
+
+            parsed = _parse_log_filename(entry.name)
+            if parsed is None:
+                continue
+
+            file_username, log_datetime = parsed
+
+            # The username is in the filename, so filter before reading the file
+            if username is not None and file_username != username:
+                continue
+
+            candidates.append((log_datetime, file_username, entry.name, entry.path))
+
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+    # Logs are ordered by the created_at in their frontmatter, which falls
+    # within the second (or, for legacy names, the day) given by the filename.
+    # A legacy file's day can overlap timed files sorted ahead of it, so track
+    # the latest created_at any remaining file could have.
+    remaining_bounds = [""] * len(candidates)
+    latest_bound = ""
+    for i in range(len(candidates) - 1, -1, -1):
+        log_datetime = candidates[i][0]
+        if log_datetime.time() == time.min:
+            upper_bound = log_datetime + timedelta(days=1)
+        else:
+            upper_bound = log_datetime + timedelta(seconds=1)
+        latest_bound = max(latest_bound, upper_bound.isoformat())
+        remaining_bounds[i] = latest_bound
+
+    logs: list[dict[str, Any]] = []
+    # Min-heap of the newest `limit` logs as (created_at, -read order, log);
+    # on equal created_at the earlier read log ranks higher
+    newest: list[tuple[str, int, dict[str, Any]]] = []
+    for i, (log_datetime, file_username, filename, path) in enumerate(candidates):
+        # Stop once no remaining file can rank above the kth newest log
+        if limit > 0 and len(newest) >= limit and newest[0][0] >= remaining_bounds[i]:
+            break
+
+        log_file = Path(path)
+
+        # Check the spec from the frontmatter alone before loading the body
+        if spec_slug is not None:
+            if read_md_header(log_file).get("spec_slug") != spec_slug:
+                continue
+
+        metadata, body = read_md_file(log_file)
 
-        parsed = _parse_log_filename(log_file.name)
-        if parsed is None:
+        log = _log_to_dict(file_username, log_datetime, metadata, body, filename)
+        if limit <= 0:
+            logs.append(log)
             continue
 
-        file_username, log_datetime = parsed
+        item = (_log_created_at(log), -i, log)
+        if len(newest) < limit:
+            heapq.heappush(newest, item)
+        elif item > newest[0]:
+            heapq.heapreplace(newest, item)
 
-        metadata, body = read_md_file(log_file)
+    if limit > 0:
+        # Read order is unique, so the log dicts themselves are never compared
+        return [log for _, _, log in sorted(newest, reverse=True)]
 
-        if spec_slug is not None and metadata.get("spec_slug") != spec_slug:
-            continue
+    logs.sort(key=_log_created_at, reverse=True)
+    return logs[:limit]
 
-        if username is not None and file_username != username:
-            continue
 
-        logs.append(
-            _log_to_dict(file_username, log_datetime, metadata, body, log_file.name)
-        )
+def _read_log_or_raise(filename: str) -> tuple[Path, dict, str]:
+    """Read a log by filename, return (path, metadata, body).
+
+    Opens the file directly instead of checking exists() first.
+    Raises ValueError if the log doesn't exist.
+    """
+    log_file = _get_logs_dir() / filename
 
-    # Sort by created_at, newest first
-    logs.sort(key=lambda log: log.get("created_at", ""), reverse=True)
+    try:
+        metadata, body = read_md_file(log_file)
+    except FileNotFoundError:
+        raise ValueError(f"Log '{filename}' not found") from None
 
-    return logs[:limit]
+    return log_file, metadata, body
 
 
 def update_log(filename: str, **updates) -> None:
     """Update log frontmatter fields by filename."""
     log_file = _get_logs_dir() / filename
 
-    if not log_file.exists():
-        raise ValueError(f"Log '{filename}' not found")
-
-    metadata, body = read_md_file(log_file)
+    try:
+        update_md_frontmatter(log_file, updates)
+    except FileNotFoundError:
+        raise ValueError(f"Log '{filename}' not found") from None
 
-    for key, value in updates.items():
-        metadata[key] = value
 
+def update_log_body(filename: str, body: str) -> None:
+    """Update log body content by filename."""
+    log_file, metadata, _ = _read_log_or_raise(filename)
     write_md_file(log_file, metadata, body)
 
 
-def update_log_body(filename: str, body: str) -> None:
-    """Update log body content by filename."""
-    log_file = _get_logs_dir() / filename
+def _line_at(text: str, start: int) -> str:
+    """Return the stripped line of text beginning at index start."""
+    end = text.find("\n", start)
+    return text[start : end if end >= 0 else len(text)].strip()
 
-    if not log_file.exists():
-        raise ValueError(f"Log '{filename}' not found")
 
-    metadata, _ = read_md_file(log_file)
-    write_md_file(log_file, metadata, body)
+def _find_section_header(body: str, section_header: str) -> int | None:
+    """Return the index just past a line consisting of section_header, if any."""
+    index = body.find(section_header)
+    while index >= 0:
+        line_start = body.rfind("\n", 0, index) + 1
+        if _line_at(body, line_start) == section_header:
+            line_end = body.find("\n", index)
+            return line_end if line_end >= 0 else len(body)
+        index = body.find(section_header, index + 1)
+    return None
 
 
 def append_to_log(filename: str, section: str, content: str) -> None:
     """Append content to a section of a log file."""
-    log_file = _get_logs_dir() / filename
-
-    if not log_file.exists():
-        raise ValueError(f"Log '{filename}' not found")
-
-    metadata, body = read_md_file(log_file)
+    log_file, metadata, body = _read_log_or_raise(filename)
 
     # Find the section and append to it
     section_header = f"## {section}"
-    if section_header in body:
-        # Find the section and the next section
-        lines = body.split("\n")
-        new_lines = []
-        in_section = False
-        appended = False
-
-        for i, line in enumerate(lines):
-            new_lines.append(line)
-
-            if line.strip() == section_header:
-                in_section = True
-            elif in_section and line.startswith("## "):
-                # Next section found, insert content before it
-                new_lines.insert(-1, content)
-                new_lines.insert(-1, "")
-                in_section = False
-                appended = True
-
-        if in_section and not appended:
-            # Section was at the end
-            new_lines.append(content)
-
-        body = "\n".join(new_lines)
+    header_end = _find_section_header(body, section_header)
+    if header_end is not None:
+        # Insert before the next "## " heading, or at the end of the body
+        next_header = body.find("\n## ", header_end)
+        while next_header >= 0 and _line_at(body, next_header + 1) == section_header:
+            next_header = body.find("\n## ", next_header + 1)
+
+        if next_header >= 0:
+            body = f"{body[:next_header]}\n{content}\n{body[next_header:]}"
+        else:
+            body = f"{body}\n{content}"
     else:
         # Section doesn't exist, add it
         body = body.rstrip() + f"\n\n## {section}\n\n{content}\n"
@@ -294,7 +403,7 @@ def delete_log(filename: str) -> None:
     """Delete a log file by filename."""
     log_file = _get_logs_dir() / filename
 
-    if not log_file.exists():
-        raise ValueError(f"Log '{filename}' not found")
-
-    log_file.unlink()
+    try:
+        log_file.unlink()
+    except FileNotFoundError:
+        raise ValueError(f"Log '{filename}' not found") from None
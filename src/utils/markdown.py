@@ -1,10 +1,55 @@
 """Markdown utilities for parsing and writing files with YAML frontmatter."""
 
+import copy
+import os
 import re
+import sys
+from collections import OrderedDict
 from pathlib import Path
 
 import yaml
 
+# Use libyaml's C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+# Parsed (metadata, body) per path, validated by (mtime_ns, size, inode)
+_PARSE_CACHE_SIZE = 1024
+_parse_cache: OrderedDict[Path, tuple[tuple[int, int, int], dict, str]] = OrderedDict()
+# Metadata from read_md_header per path, validated the same way
+_header_cache: OrderedDict[Path, tuple[tuple[int, int, int], dict]] = OrderedDict()
+
+# read_md_files reads uncached files in a thread pool once there are this many
+_PARALLEL_READ_MIN = 8
+_READ_WORKERS = 16
+
+# Frontmatter fields whose values come from a small fixed set, so interning
+# them shares one string across every spec, task and todo
+_INTERNED_VALUE_KEYS = frozenset({"status"})
+
+# Frontmatter lines update_md_frontmatter can edit in place: a plain key with
+# a value on the same line that doesn't open a block scalar or nested mapping
+_SIMPLE_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_SIMPLE_ENTRY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*: +[^\s|>&*!#].*")
+
+_SLUG_SEP_RE = re.compile(r"[\s\-]+")
+_SLUG_KEEP_RE = re.compile(r"[^a-z0-9_]")
+_SLUG_COLLAPSE_RE = re.compile(r"_+")
+
+# ASCII-only equivalent of the regexes above: separators become underscores,
+# anything else outside [a-z0-9_] is deleted (input is lowercased first)
+_SLUG_ASCII_TABLE = str.maketrans(
+    {
+        **{chr(c): None for c in range(128)},
+        **{c: c for c in "abcdefghijklmnopqrstuvwxyz0123456789_"},
+        **{c: "_" for c in " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f-"},
+    }
+)
+
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter and body from markdown.
@@ -17,23 +62,45 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
 
     Returns (metadata, body). If no frontmatter, returns ({}, content).
     """
-    if not content.startswith("---"):
+    if not content.startswith("---\n"):
         return {}, content
 
-    # Find the closing ---
-    match = re.match(r"^---\n(.*?)\n---\n?(.*)", content, re.DOTALL)
-    if not match:
+    # Find the closing --- with plain string search; the delimiters are fixed
+    end = content.find("\n---", 4)
+    if end < 0:
         return {}, content
 
-    frontmatter_str = match.group(1)
-    body = match.group(2)
+    frontmatter_str = content[4:end]
+    body_start = end + 4
+    if content.startswith("\n", body_start):
+        body_start += 1
+    body = content[body_start:]
 
     try:
-        metadata = yaml.safe_load(frontmatter_str) or {}
+        metadata = yaml.load(frontmatter_str, Loader=_Loader) or {}
     except yaml.YAMLError:
         return {}, content
 
-    return metadata, body
+    return _intern_metadata(metadata), body
+
+
+def _intern_metadata(metadata: dict) -> dict:
+    """Intern top-level keys and enum-like values of parsed frontmatter.
+
+    Listings hold one dict per spec or task with the same keys and a handful
+    of status values. Unique values such as titles and timestamps are left
+    alone.
+    """
+    if not isinstance(metadata, dict):
+        return metadata
+    return {
+        (sys.intern(key) if isinstance(key, str) else key): (
+            sys.intern(value)
+            if key in _INTERNED_VALUE_KEYS and isinstance(value, str)
+            else value
+        )
+        for key, value in metadata.items()
+    }
 
 
 def dump_frontmatter(metadata: dict, body: str) -> str:
@@ -50,6 +117,7 @@ def dump_frontmatter(metadata: dict, body: str) -> str:
 
     frontmatter_str = yaml.dump(
         metadata,
+        Dumper=_Dumper,
         default_flow_style=False,
         allow_unicode=True,
         sort_keys=False,
@@ -62,23 +130,250 @@ def dump_frontmatter(metadata: dict, body: str) -> str:
     return f"---\n{frontmatter_str}---{body}"
 
 
+def _get_cached(cache: OrderedDict, path: Path) -> tuple | None:
+    """Return the cache entry for path if the file is unchanged.
+
+    Validated with a single stat, so a hit never opens the file. Listing the
+    same specs or tasks repeatedly within a command then costs one stat each.
+    Raises FileNotFoundError if a cached file has been removed.
+    """
+    cached = cache.get(path)
+    if cached is None:
+        return None
+
+    st = os.stat(path)
+    if cached[0] != (st.st_mtime_ns, st.st_size, st.st_ino):
+        return None
+
+    cache.move_to_end(path)
+    return cached
+
+
+def _copy_metadata(metadata: dict) -> dict:
+    """Copy cached metadata for a caller, deep-copying only container values."""
+    return {
+        key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        for key, value in metadata.items()
+    }
+
+
+def _store_cached(cache: OrderedDict, path: Path, entry: tuple) -> None:
+    cache[path] = entry
+    if len(cache) > _PARSE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
 def read_md_file(path: Path) -> tuple[dict, str]:
     """Read a markdown file, return (metadata, body).
 
+    Parsed results are cached per path and reused while the file's mtime,
+    size and inode are unchanged. Callers get their own copy of the metadata,
+    including nested lists and dicts, so mutating it does not affect the cache.
+
     Raises FileNotFoundError if file doesn't exist.
     """
-    content = path.read_text()
-    return parse_frontmatter(content)
+    cached = _get_cached(_parse_cache, path)
+    if cached is not None:
+        return _copy_metadata(cached[1]), cached[2]
+
+    return _parse_and_store(path, *_read_with_signature(path))
+
+
+def read_md_files(paths: list[Path]) -> list[tuple[dict, str] | None]:
+    """Read several markdown files, return (metadata, body) per path in order.
+
+    Behaves like read_md_file for each path, except that a missing file gives
+    None instead of raising. Files not in the cache are read in a thread pool
+    when there are enough of them; parsing and cache updates stay on the
+    calling thread.
+    """
+    results: list[tuple[dict, str] | None] = [None] * len(paths)
+    misses = []
+    for i, path in enumerate(paths):
+        try:
+            cached = _get_cached(_parse_cache, path)
+        except FileNotFoundError:
+            continue
+        if cached is not None:
+            results[i] = (_copy_metadata(cached[1]), cached[2])
+        else:
+            misses.append(i)
+
+    def read_or_none(path: Path) -> tuple[tuple[int, int, int], str] | None:
+        try:
+            return _read_with_signature(path)
+        except FileNotFoundError:
+            return None
+
+    miss_paths = [paths[i] for i in misses]
+    if len(miss_paths) >= _PARALLEL_READ_MIN:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(_READ_WORKERS, len(miss_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            contents = list(executor.map(read_or_none, miss_paths))
+    else:
+        contents = [read_or_none(path) for path in miss_paths]
+
+    for i, read in zip(misses, contents):
+        if read is not None:
+            results[i] = _parse_and_store(paths[i], *read)
+
+    return results
+
+
+def _read_with_signature(path: Path) -> tuple[tuple[int, int, int], str]:
+    """Read a file's text along with its (mtime_ns, size, inode) signature."""
+    with open(path) as f:
+        st = os.fstat(f.fileno())
+        return (st.st_mtime_ns, st.st_size, st.st_ino), f.read()
+
+
+def _parse_and_store(
+    path: Path, signature: tuple[int, int, int], content: str
+) -> tuple[dict, str]:
+    metadata, body = parse_frontmatter(content)
+    _store_cached(_parse_cache, path, (signature, metadata, body))
+    return _copy_metadata(metadata), body
+
+
+def read_md_header(path: Path) -> dict:
+    """Read only the frontmatter of a markdown file, return its metadata.
+
+    Stops reading at the closing delimiter, so the body is never loaded.
+    Returns the same metadata read_md_file would.
+
+    Raises FileNotFoundError if file doesn't exist.
+    """
+    cached = _get_cached(_parse_cache, path) or _get_cached(_header_cache, path)
+    if cached is not None:
+        return _copy_metadata(cached[1])
+
+    with open(path) as f:
+        st = os.fstat(f.fileno())
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        metadata = _read_frontmatter_lines(f)
+
+    _store_cached(_header_cache, path, (signature, metadata))
+    return _copy_metadata(metadata)
+
+
+def read_md_headers(paths: list[Path]) -> list[tuple[dict, str] | None]:
+    """Read the frontmatter of several files, return (metadata, "") per path.
+
+    The header-only counterpart to read_md_files: a missing file gives None
+    instead of raising.
+    """
+    results: list[tuple[dict, str] | None] = []
+    for path in paths:
+        try:
+            results.append((read_md_header(path), ""))
+        except FileNotFoundError:
+            results.append(None)
+    return results
+
+
+def _read_frontmatter_lines(f) -> dict:
+    """Parse the frontmatter block from an open file, reading no further."""
+    if f.readline() != "---\n":
+        return {}
+
+    lines = []
+    for line_number, line in enumerate(f, start=2):
+        # The second line cannot close the block (see parse_frontmatter)
+        if line.startswith("---") and line_number > 2:
+            break
+        lines.append(line)
+    else:
+        return {}
+
+    try:
+        return _intern_metadata(yaml.load("".join(lines)[:-1], Loader=_Loader) or {})
+    except yaml.YAMLError:
+        return {}
 
 
 def write_md_file(path: Path, metadata: dict, body: str) -> None:
     """Write markdown file with frontmatter.
 
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. The content is written to
+    a temporary file next to the target and moved into place, so a failed
+    write never leaves a truncated file behind.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    content = dump_frontmatter(metadata, body)
-    path.write_text(content)
+    _write_text_atomic(path, dump_frontmatter(metadata, body))
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write content via a temporary file moved into place with os.replace.
+
+    The temporary name includes the process id, so concurrent writers of the
+    same file never share it, and it is removed if the write fails.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        try:
+            tmp_path.write_text(content)
+        except FileNotFoundError:
+            # Only create parent directories when they are actually missing
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _parse_cache.pop(path, None)
+    _header_cache.pop(path, None)
+
+
+def update_md_frontmatter(path: Path, updates: dict) -> None:
+    """Set top-level frontmatter fields of a markdown file.
+
+    When every update is a scalar and the frontmatter consists only of
+    single-line "key: value" entries, the changed lines are spliced into the
+    existing text and the body is copied through untouched. Otherwise falls
+    back to a full read_md_file/write_md_file round-trip.
+
+    Raises FileNotFoundError if file doesn't exist.
+    """
+    content = path.read_text()
+
+    header_end = content.find("\n---", 4) if content.startswith("---\n") else -1
+    header_lines = content[4:header_end].split("\n") if header_end >= 0 else []
+    simple = (
+        bool(header_lines)
+        and all(_is_simple_scalar(value) for value in updates.values())
+        and all(_SIMPLE_KEY_RE.fullmatch(key) for key in updates)
+        and all(_SIMPLE_ENTRY_RE.fullmatch(line) for line in header_lines)
+    )
+    if not simple:
+        metadata, body = read_md_file(path)
+        metadata.update(updates)
+        write_md_file(path, metadata, body)
+        return
+
+    line_index = {line.partition(":")[0]: i for i, line in enumerate(header_lines)}
+    for key, value in updates.items():
+        # Dump each entry on its own so quoting matches a full dump
+        entry = yaml.dump(
+            {key: value},
+            Dumper=_Dumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        ).rstrip("\n")
+        if key in line_index:
+            header_lines[line_index[key]] = entry
+        else:
+            line_index[key] = len(header_lines)
+            header_lines.append(entry)
+
+    _write_text_atomic(
+        path, "---\n" + "\n".join(header_lines) + content[header_end:]
+    )
+
+
+def _is_simple_scalar(value) -> bool:
+    return value is None or isinstance(value, (str, int, float))
 
 
 def slugify(text: str) -> str:
@@ -89,17 +384,24 @@ def slugify(text: str) -> str:
     - Removes consecutive underscores
     - Strips leading/trailing underscores
     """
+    if text.isascii():
+        # Same result as the regex passes below, using only str methods
+        slug = text.lower().translate(_SLUG_ASCII_TABLE)
+        while "__" in slug:
+            slug = slug.replace("__", "_")
+        return slug.strip("_")
+
     # Lowercase
     slug = text.lower()
 
     # Replace spaces and common separators with underscores
-    slug = re.sub(r"[\s\-]+", "_", slug)
+    slug = _SLUG_SEP_RE.sub("_", slug)
 
     # Remove anything that isn't alphanumeric or underscore
-    slug = re.sub(r"[^a-z0-9_]", "", slug)
+    slug = _SLUG_KEEP_RE.sub("", slug)
 
     # Collapse multiple underscores
-    slug = re.sub(r"_+", "_", slug)
+    slug = _SLUG_COLLAPSE_RE.sub("_", slug)
 
     # Strip leading/trailing underscores
     slug = slug.strip("_")
@@ -2,12 +2,15 @@
 Migration utilities for converting agent_rules/ format to .mem/ format.
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 from src.models import LogFrontmatter, SpecFrontmatter, TaskFrontmatter
 from src.utils.ai.log_parser import parse_log
+from src.utils.ai.models import ParsedLog, ParsedSpec
 from src.utils.ai.spec_parser import parse_spec
 from src.utils.github.api import (
     close_issue_with_comment,
@@ -16,15 +19,23 @@ from src.utils.github.api import (
 )
 from src.utils.github.client import get_github_client
 from src.utils.github.repo import get_repo_from_git
+from src.utils.logs import _datetime_from_digits
 from src.utils.markdown import read_md_file, slugify, write_md_file
 
+_OLD_SPEC_RE = re.compile(r"s_(\d{8})_(.+?)__(.+)\.md")
+_OLD_LOG_RE = re.compile(r"w_(\d{12})_(.+)\.md")
+_SPEC_REF_RE = re.compile(r"s_\d+_[^_]+__(.+)\.md")
+
+# Concurrent AI parser calls during migration
+MIGRATION_WORKERS = 8
+
 
 def parse_old_spec_filename(filename: str) -> tuple[str, str, str]:
     """Parse old spec filename pattern: s_YYYYMMDD_username__feature_name.md
 
     Returns (date_str, username, feature_name).
     """
-    match = re.match(r"s_(\d{8})_(.+?)__(.+)\.md", filename)
+    match = _OLD_SPEC_RE.match(filename)
     if match:
         return match.group(1), match.group(2), match.group(3)
     return "", "", ""
@@ -35,7 +46,7 @@ def parse_old_log_filename(filename: str) -> tuple[str, str]:
 
     Returns (datetime_str, username).
     """
-    match = re.match(r"w_(\d{12})_(.+)\.md", filename)
+    match = _OLD_LOG_RE.match(filename)
     if match:
         return match.group(1), match.group(2)
     return "", ""
@@ -46,26 +57,49 @@ def discover_files(agent_rules_dir: Path) -> tuple[list[Path], list[Path]]:
 
     Returns (spec_files, log_files).
     """
-    spec_dir = agent_rules_dir / "spec"
-    log_dir = agent_rules_dir / "work_log"
-
-    spec_files = sorted(spec_dir.glob("s_*_*.md")) if spec_dir.exists() else []
-    log_files = sorted(log_dir.glob("w_*_*.md")) if log_dir.exists() else []
+    spec_files = _scan_old_files(agent_rules_dir / "spec", "s_")
+    log_files = _scan_old_files(agent_rules_dir / "work_log", "w_")
 
     return spec_files, log_files
 
 
+def _scan_old_files(directory: Path, prefix: str) -> list[Path]:
+    """List files named {prefix}*_*.md in a directory, sorted by path.
+
+    Matches the glob pattern with plain string checks on a single scandir pass.
+    Returns [] if the directory doesn't exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(".md")
+                and "_" in entry.name[len(prefix) : -3]
+                and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+
+
 def convert_spec(spec_file: Path, mem_dir: Path, dry_run: bool = False) -> dict | None:
     """Convert an old spec file to mem format using AI agent.
 
     Returns spec info dict with slug, title, spec_dir for later GitHub operations.
     """
+    parsed = parse_spec(spec_file.read_text())
+    return _convert_parsed_spec(spec_file, parsed, mem_dir, dry_run)
+
+
+def _convert_parsed_spec(
+    spec_file: Path, parsed: ParsedSpec | None, mem_dir: Path, dry_run: bool
+) -> dict | None:
+    """Write the mem spec and tasks for an already parsed old spec file."""
     print(f"   Processing: {spec_file.name}")
 
     date_str, username, _ = parse_old_spec_filename(spec_file.name)
-    content = spec_file.read_text()
 
-    parsed = parse_spec(content)
     if not parsed:
         print("      Failed to parse spec")
         return None
@@ -77,7 +111,7 @@ def convert_spec(spec_file: Path, mem_dir: Path, dry_run: bool = False) -> dict
 
     if date_str:
         try:
-            created_dt = datetime.strptime(date_str, "%Y%m%d")
+            created_dt = _datetime_from_digits(date_str)
         except ValueError:
             created_dt = datetime.now()
     else:
@@ -138,6 +172,22 @@ def convert_log(log_file: Path, mem_dir: Path, dry_run: bool = False) -> bool:
 
     Returns True if successful.
     """
+    parsed = None
+    if _has_old_log_filename(log_file):
+        parsed = parse_log(log_file.read_text())
+    return _convert_parsed_log(log_file, parsed, mem_dir, dry_run)
+
+
+def _has_old_log_filename(log_file: Path) -> bool:
+    """Check whether a log filename carries the datetime and username."""
+    datetime_str, username = parse_old_log_filename(log_file.name)
+    return bool(datetime_str and username)
+
+
+def _convert_parsed_log(
+    log_file: Path, parsed: ParsedLog | None, mem_dir: Path, dry_run: bool
+) -> bool:
+    """Write the mem log for an already parsed old work log file."""
     print(f"   Processing: {log_file.name}")
 
     datetime_str, username = parse_old_log_filename(log_file.name)
@@ -147,13 +197,11 @@ def convert_log(log_file: Path, mem_dir: Path, dry_run: bool = False) -> bool:
         return False
 
     try:
-        created_dt = datetime.strptime(datetime_str, "%Y%m%d%H%M")
+        # datetime_str is the 12 digits YYYYMMDDHHmm from _OLD_LOG_RE
+        created_dt = _datetime_from_digits(datetime_str[:8], datetime_str[8:12] + "00")
     except ValueError:
         created_dt = datetime.now()
 
-    content = log_file.read_text()
-
-    parsed = parse_log(content)
     if not parsed:
         print("      Failed to parse log")
         return False
@@ -164,7 +212,7 @@ def convert_log(log_file: Path, mem_dir: Path, dry_run: bool = False) -> bool:
 
     spec_slug = None
     if spec_file_path:
-        match = re.search(r"s_\d+_[^_]+__(.+)\.md", spec_file_path)
+        match = _SPEC_REF_RE.search(spec_file_path)
         if match:
             spec_slug = slugify(match.group(1))
 
@@ -194,6 +242,33 @@ def convert_log(log_file: Path, mem_dir: Path, dry_run: bool = False) -> bool:
     return True
 
 
+def _parse_files_concurrently(parser, files: list[Path]) -> list:
+    """Run an AI parser over the contents of files, returning results in order.
+
+    The parsers are network-bound agent calls, so they run in a thread pool.
+    A file whose parse raises gets None, like any other failed parse.
+    """
+    if not files:
+        return []
+
+    def parse_file(file: Path):
+        try:
+            return parser(file.read_text())
+        except Exception as e:
+            print(f"   Error parsing {file.name}: {e}")
+            return None
+
+    results: list = [None] * len(files)
+    max_workers = min(MIGRATION_WORKERS, len(files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(parse_file, file): i for i, file in enumerate(files)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            results[i] = future.result()
+            print(f"   Parsed {done}/{len(files)}: {files[i].name}")
+    return results
+
+
 def create_github_issues_for_specs(
     specs: list[dict], target_dir: Path, dry_run: bool = False
 ) -> None:
@@ -231,9 +306,10 @@ def create_github_issues_for_specs(
 
             issue = create_github_issue(repo, title=title, body=body, labels=labels)
 
+            # Pass the created Issue itself so closing doesn't re-fetch it
             close_issue_with_comment(
                 repo,
-                issue.number,
+                issue,
                 "Migrated from legacy agent_rules system - already completed.",
             )
 
@@ -272,18 +348,24 @@ def run_migration(target_dir: Path, dry_run: bool = False) -> None:
         print("\nNo files to migrate.")
         return
 
+    # Parse every file up front in parallel; files are then written in order
     migrated_specs = []
     if spec_files:
         print("\n2. Converting specs...")
-        for spec_file in spec_files:
-            result = convert_spec(spec_file, mem_dir, dry_run)
+        parsed_specs = _parse_files_concurrently(parse_spec, spec_files)
+        for spec_file, parsed in zip(spec_files, parsed_specs):
+            result = _convert_parsed_spec(spec_file, parsed, mem_dir, dry_run)
             if result:
                 migrated_specs.append(result)
 
     if log_files:
         print("\n3. Converting work logs...")
+        parsable_logs = [f for f in log_files if _has_old_log_filename(f)]
+        parsed_logs = dict(
+            zip(parsable_logs, _parse_files_concurrently(parse_log, parsable_logs))
+        )
         for log_file in log_files:
-            convert_log(log_file, mem_dir, dry_run)
+            _convert_parsed_log(log_file, parsed_logs.get(log_file), mem_dir, dry_run)
 
     create_github_issues_for_specs(migrated_specs, target_dir, dry_run)
 
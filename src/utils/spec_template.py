@@ -9,6 +9,7 @@ The spec.md template is the single source of truth - it's used for:
 2. GitHub issue template (copied with frontmatter added)
 """
 
+import functools
 from pathlib import Path
 
 from env_settings import ENV_SETTINGS
@@ -39,6 +40,10 @@ DEFAULT_SPEC_TEMPLATE = """\
 """
 
 
+# Global config dirs already set up by ensure_global_config_exists
+_bootstrapped_dirs: set[Path] = set()
+
+
 def get_global_spec_template_path() -> Path:
     """Get path to global spec template."""
     return ENV_SETTINGS.global_config_dir / "templates" / "spec.md"
@@ -52,23 +57,55 @@ def get_local_spec_template_path() -> Path:
 def ensure_global_config_exists() -> None:
     """Ensure ~/.config/mem/ and default templates exist."""
     global_dir = ENV_SETTINGS.global_config_dir
+    if global_dir in _bootstrapped_dirs:
+        return
+
     templates_dir = global_dir / "templates"
+    spec_template_path = templates_dir / "spec.md"
 
-    # Create directories
-    templates_dir.mkdir(parents=True, exist_ok=True)
+    # Create the default spec template only if it doesn't exist; exclusive
+    # creation checks and creates in one step, and directories are only
+    # created when the first attempt finds them missing
+    try:
+        _create_file(spec_template_path, DEFAULT_SPEC_TEMPLATE)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        templates_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            _create_file(spec_template_path, DEFAULT_SPEC_TEMPLATE)
+        except FileExistsError:
+            pass
 
-    # Create default spec template if it doesn't exist
-    spec_template_path = templates_dir / "spec.md"
-    if not spec_template_path.exists():
-        spec_template_path.write_text(DEFAULT_SPEC_TEMPLATE)
+    _bootstrapped_dirs.add(global_dir)
+
+
+def _create_file(path: Path, content: str) -> None:
+    """Write content to a new file; raises FileExistsError if it exists."""
+    with path.open("x") as f:
+        f.write(content)
 
 
 def load_spec_template() -> str:
-    """Load spec template, preferring global over local."""
-    global_path = get_global_spec_template_path()
-    if global_path.exists():
-        return global_path.read_text()
-    return get_local_spec_template_path().read_text()
+    """Load spec template, preferring global over local.
+
+    Template contents are cached per file version (mtime and size), so edits
+    to the global template are still picked up.
+    """
+    try:
+        return _read_template(get_global_spec_template_path())
+    except FileNotFoundError:
+        return _read_template(get_local_spec_template_path())
+
+
+def _read_template(path: Path) -> str:
+    st = path.stat()
+    return _read_template_version(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_template_version(path: Path, mtime_ns: int, size: int) -> str:
+    return path.read_text()
 
 
 def generate_github_issue_template(template: str | None = None) -> str:
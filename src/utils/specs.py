@@ -12,20 +12,36 @@ This is derived at runtime, not stored in the status field.
 Each spec.md has YAML frontmatter with metadata and markdown body.
 """
 
+import errno
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from git import Repo
-from git.exc import InvalidGitRepositoryError
-
 from env_settings import ENV_SETTINGS
 from src.models import create_spec_frontmatter
-from src.utils.markdown import read_md_file, slugify, write_md_file
+from src.utils.markdown import (
+    read_md_file,
+    read_md_files,
+    read_md_headers,
+    slugify,
+    update_md_frontmatter,
+    write_md_file,
+)
 from src.utils.worktrees import get_spec_slug_from_worktree, is_worktree
 
 
+# Resolved spec directory per (specs dir, slug), see _find_spec_dir
+_spec_dir_cache: dict[tuple[Path, str], Path] = {}
+
+# issue_id -> slug per specs dir, see get_spec_by_issue_id
+_issue_index_cache: dict[Path, dict[int, str]] = {}
+
+# Slug last matched per (specs dir, branch), see _find_spec_for_branch
+_branch_spec_cache: dict[tuple[Path, str], str] = {}
+
+
 def _get_template_dir() -> Path:
     """Get the templates directory path."""
     return Path(__file__).parent.parent / "templates"
@@ -56,24 +72,35 @@ def _get_abandoned_dir() -> Path:
 def _find_spec_dir(slug: str) -> Path | None:
     """Find spec directory across all locations (root, completed, abandoned).
 
+    Resolved locations are cached per process; a cached hit is re-checked with
+    a single stat of its spec.md before being returned.
+
     Returns the path to the spec directory, or None if not found.
     """
-    # Check root specs dir first
-    root_path = _get_specs_dir() / slug
-    if root_path.exists() and (root_path / "spec.md").exists():
-        return root_path
+    specs_dir = _get_specs_dir()
+    cache_key = (specs_dir, slug)
+    cached = _spec_dir_cache.get(cache_key)
+    if cached is not None:
+        if os.path.exists(os.path.join(cached, "spec.md")):
+            return cached
+        del _spec_dir_cache[cache_key]
+
+    # Check root specs dir first, then completed, then abandoned
+    for spec_dir in (
+        specs_dir / slug,
+        specs_dir / "completed" / slug,
+        specs_dir / "abandoned" / slug,
+    ):
+        if os.path.exists(os.path.join(spec_dir, "spec.md")):
+            _spec_dir_cache[cache_key] = spec_dir
+            return spec_dir
 
-    # Check completed
-    completed_path = _get_completed_dir() / slug
-    if completed_path.exists() and (completed_path / "spec.md").exists():
-        return completed_path
+    return None
 
-    # Check abandoned
-    abandoned_path = _get_abandoned_dir() / slug
-    if abandoned_path.exists() and (abandoned_path / "spec.md").exists():
-        return abandoned_path
 
-    return None
+def _forget_spec_dir(slug: str) -> None:
+    """Drop the cached location of a spec that is being moved or removed."""
+    _spec_dir_cache.pop((_get_specs_dir(), slug), None)
 
 
 def _get_spec_dir(slug: str) -> Path:
@@ -123,6 +150,7 @@ def create_spec(title: str) -> Path:
     body = _load_spec_template()
 
     write_md_file(spec_file, frontmatter.to_dict(), body)
+    _forget_spec_dir(slug)
     return spec_file
 
 
@@ -132,43 +160,76 @@ def get_spec(slug: str) -> dict[str, Any] | None:
     Returns dict with all metadata fields plus 'slug' and 'body',
     or None if spec doesn't exist.
     """
-    spec_file = _get_spec_file(slug)
-
-    if not spec_file.exists():
+    try:
+        metadata, body = read_md_file(_get_spec_file(slug))
+    except FileNotFoundError:
         return None
 
-    metadata, body = read_md_file(spec_file)
     return _spec_to_dict(slug, metadata, body)
 
 
 def get_spec_by_issue_id(issue_id: int) -> dict[str, Any] | None:
-    """Find spec with matching issue_id in frontmatter."""
-    for spec in list_specs():
-        if spec.get("issue_id") == issue_id:
-            return spec
-    return None
+    """Find spec with matching issue_id in frontmatter.
+
+    Uses a per-process issue_id -> slug index; a hit is verified against the
+    spec itself, and the index is rebuilt from spec headers when it is
+    missing or out of date.
+    """
+    specs_dir = _get_specs_dir()
+    index = _issue_index_cache.get(specs_dir)
+    if index is not None and issue_id in index:
+        slug = index[issue_id]
+        if _find_spec_dir(slug) == specs_dir / slug:
+            spec = get_spec(slug)
+            if spec is not None and spec.get("issue_id") == issue_id:
+                return spec
+
+    index = _issue_index_cache[specs_dir] = _build_issue_index()
+    slug = index.get(issue_id)
+    return get_spec(slug) if slug is not None else None
+
+
+def _build_issue_index() -> dict[int, str]:
+    """Map issue_id -> slug for the specs list_specs() returns, from headers."""
+    index: dict[int, str] = {}
+    for spec in list_specs(include_body=False):
+        issue_id = spec.get("issue_id")
+        if issue_id is not None:
+            # Keep the first match in list_specs() order
+            index.setdefault(issue_id, spec["slug"])
+    return index
 
 
 def _list_specs_in_dir(
-    directory: Path, status_filter: str | None = None
+    directory: Path, status_filter: str | None = None, include_body: bool = True
 ) -> list[dict[str, Any]]:
-    """List specs in a specific directory, optionally filtered by status."""
-    if not directory.exists():
+    """List specs in a specific directory, optionally filtered by status.
+
+    With include_body=False only each spec's frontmatter is read and 'body' is "".
+    """
+    try:
+        with os.scandir(directory) as it:
+            # DirEntry.is_dir() is answered from the directory listing itself
+            spec_dirs = [entry for entry in it if entry.is_dir()]
+    except FileNotFoundError:
         return []
 
-    specs = []
-    for spec_dir in directory.iterdir():
-        if not spec_dir.is_dir():
-            continue
-        # Skip the completed and abandoned subdirectories
-        if spec_dir.name in ("completed", "abandoned"):
-            continue
+    # Skip the completed and abandoned subdirectories
+    spec_dirs = [d for d in spec_dirs if d.name not in ("completed", "abandoned")]
+    # Join as strings; only the final path is wrapped in a Path
+    spec_files = [Path(os.path.join(d.path, "spec.md")) for d in spec_dirs]
 
-        spec_file = spec_dir / "spec.md"
-        if not spec_file.exists():
-            continue
+    if include_body:
+        # Files missing from the cache are read concurrently
+        parsed = read_md_files(spec_files)
+    else:
+        parsed = read_md_headers(spec_files)
 
-        metadata, body = read_md_file(spec_file)
+    specs = []
+    for spec_dir, read in zip(spec_dirs, parsed):
+        if read is None:
+            continue
+        metadata, body = read
         slug = spec_dir.name
 
         if status_filter is not None and metadata.get("status") != status_filter:
@@ -179,7 +240,9 @@ def _list_specs_in_dir(
     return specs
 
 
-def list_specs(status: str | None = None) -> list[dict[str, Any]]:
+def list_specs(
+    status: str | None = None, include_body: bool = True
+) -> list[dict[str, Any]]:
     """List specs, optionally filtered by status.
 
     By default (status=None), lists only active specs from the root directory
@@ -187,16 +250,19 @@ def list_specs(status: str | None = None) -> list[dict[str, Any]]:
 
     Use status="completed" to list completed specs.
     Use status="abandoned" to list abandoned specs.
+    Use include_body=False to read only the frontmatter ('body' is then "").
 
     Returns list of spec dicts sorted by updated_at (newest first).
     """
     if status == "completed":
-        specs = _list_specs_in_dir(_get_completed_dir())
+        specs = _list_specs_in_dir(_get_completed_dir(), include_body=include_body)
     elif status == "abandoned":
-        specs = _list_specs_in_dir(_get_abandoned_dir())
+        specs = _list_specs_in_dir(_get_abandoned_dir(), include_body=include_body)
     else:
         # List from root directory, optionally filter by status
-        specs = _list_specs_in_dir(_get_specs_dir(), status_filter=status)
+        specs = _list_specs_in_dir(
+            _get_specs_dir(), status_filter=status, include_body=include_body
+        )
 
     # Sort by updated_at, newest first
     specs.sort(key=lambda s: s.get("updated_at", ""), reverse=True)
@@ -205,8 +271,14 @@ def list_specs(status: str | None = None) -> list[dict[str, Any]]:
 
 def get_current_branch() -> str | None:
     """Get the current git branch name."""
+    # GitPython is imported on first use so listing and reading specs never
+    # loads it
+    from git.exc import InvalidGitRepositoryError
+
+    from src.utils.github.repo import get_git_repo
+
     try:
-        repo = Repo(ENV_SETTINGS.caller_dir)
+        repo = get_git_repo(ENV_SETTINGS.caller_dir)
         return repo.active_branch.name
     except (InvalidGitRepositoryError, TypeError):
         return None
@@ -224,8 +296,10 @@ def ensure_on_dev_branch() -> tuple[bool, str | None]:
         return False, None
 
     if current in ("main", "test"):
+        from src.utils.github.repo import get_git_repo
+
         try:
-            repo = Repo(ENV_SETTINGS.caller_dir)
+            repo = get_git_repo(ENV_SETTINGS.caller_dir)
             repo.git.checkout("dev")
             return True, f"Switched from '{current}' to 'dev' branch"
         except Exception as e:
@@ -245,8 +319,10 @@ def get_branch_diff_stat(branch_name: str | None = None) -> str | None:
     if branch_name is None or branch_name in ("dev", "main", "master", "test"):
         return None
 
+    from src.utils.github.repo import get_git_repo
+
     try:
-        repo = Repo(ENV_SETTINGS.caller_dir)
+        repo = get_git_repo(ENV_SETTINGS.caller_dir)
         diff_stat = repo.git.diff("dev", "--stat")
         if diff_stat.strip():
             return diff_stat
@@ -285,12 +361,28 @@ def get_active_spec() -> dict[str, Any] | None:
     if current_branch in ("dev", "main", "master", "test"):
         return None
 
-    # Find spec with matching branch
-    all_specs = list_specs()  # Gets todo + other non-archived specs
-    for spec in all_specs:
-        if spec.get("branch") == current_branch:
+    return _find_spec_for_branch(current_branch)
+
+
+def _find_spec_for_branch(branch: str) -> dict[str, Any] | None:
+    """Find the spec (todo and other non-archived) whose branch field matches.
+
+    The slug of the last match per branch is remembered and re-verified
+    against the spec itself, so repeated lookups skip the full scan.
+    """
+    specs_dir = _get_specs_dir()
+    cache_key = (specs_dir, branch)
+    slug = _branch_spec_cache.get(cache_key)
+    if slug is not None and _find_spec_dir(slug) == specs_dir / slug:
+        spec = get_spec(slug)
+        if spec is not None and spec.get("branch") == branch:
             return spec
 
+    for spec in list_specs(include_body=False):
+        if spec.get("branch") == branch:
+            _branch_spec_cache[cache_key] = spec["slug"]
+            return get_spec(spec["slug"])
+
     return None
 
 
@@ -321,7 +413,8 @@ def get_branch_status() -> tuple[str, dict | None, str | None]:
     if current_branch in ("dev", "main", "master", "test"):
         return (current_branch, None, None)
 
-    active_spec = get_active_spec()
+    # Not in a worktree and on a feature branch, so match on the branch directly
+    active_spec = _find_spec_for_branch(current_branch)
     if active_spec:
         return (current_branch, active_spec, None)
 
@@ -333,34 +426,43 @@ def get_branch_status() -> tuple[str, dict | None, str | None]:
     )
 
 
-def update_spec(slug: str, **updates) -> None:
-    """Update spec frontmatter fields.
+def _read_spec_or_raise(slug: str) -> tuple[Path, dict, str]:
+    """Read a spec by slug, return (spec_file, metadata, body).
 
-    Automatically sets updated_at to current time.
+    Raises ValueError if the spec doesn't exist.
     """
     spec_file = _get_spec_file(slug)
 
-    if not spec_file.exists():
-        raise ValueError(f"Spec '{slug}' not found")
+    try:
+        metadata, body = read_md_file(spec_file)
+    except FileNotFoundError:
+        raise ValueError(f"Spec '{slug}' not found") from None
 
-    metadata, body = read_md_file(spec_file)
+    return spec_file, metadata, body
 
-    for key, value in updates.items():
-        metadata[key] = value
 
-    metadata["updated_at"] = _now_iso()
+def update_spec(slug: str, **updates) -> None:
+    """Update spec frontmatter fields.
 
-    write_md_file(spec_file, metadata, body)
+    Automatically sets updated_at to current time, unless the caller passes
+    updated_at along with other timestamps taken at the same moment.
+    """
+    if "updated_at" not in updates:
+        updates["updated_at"] = _now_iso()
 
+    # One read and one write; the body is copied through unparsed when possible
+    try:
+        update_md_frontmatter(_get_spec_file(slug), updates)
+    except FileNotFoundError:
+        raise ValueError(f"Spec '{slug}' not found") from None
 
-def update_spec_body(slug: str, body: str) -> None:
-    """Update spec body content (for sync)."""
-    spec_file = _get_spec_file(slug)
+    if "issue_id" in updates:
+        _issue_index_cache.pop(_get_specs_dir(), None)
 
-    if not spec_file.exists():
-        raise ValueError(f"Spec '{slug}' not found")
 
-    metadata, _ = read_md_file(spec_file)
+def update_spec_body(slug: str, body: str) -> None:
+    """Update spec body content (for sync)."""
+    spec_file, metadata, _ = _read_spec_or_raise(slug)
     metadata["updated_at"] = _now_iso()
 
     write_md_file(spec_file, metadata, body)
@@ -410,9 +512,11 @@ def mark_spec_synced(
     remote_content_hash: str,
 ) -> None:
     """Mark a spec as synced with GitHub."""
+    now = _now_iso()
     update_spec(
         slug,
-        last_synced_at=_now_iso(),
+        last_synced_at=now,
+        updated_at=now,
         local_content_hash=local_content_hash,
         remote_content_hash=remote_content_hash,
     )
@@ -440,10 +544,11 @@ def delete_spec(slug: str) -> None:
     """
     spec_dir = _get_spec_dir(slug)
 
-    if not spec_dir.exists():
-        raise ValueError(f"Spec '{slug}' not found")
-
-    shutil.rmtree(spec_dir)
+    _forget_spec_dir(slug)
+    try:
+        shutil.rmtree(spec_dir)
+    except FileNotFoundError:
+        raise ValueError(f"Spec '{slug}' not found") from None
 
 
 def move_spec_to_completed(slug: str) -> Path:
@@ -452,24 +557,14 @@ def move_spec_to_completed(slug: str) -> Path:
     Updates the spec status to 'completed' and moves the directory.
     Returns the new path to the spec directory.
     """
-    spec_dir = _find_spec_dir(slug)
-    if spec_dir is None:
-        raise ValueError(f"Spec '{slug}' not found")
-
-    # Update status before moving
-    update_spec(slug, status="completed", completed_at=_now_iso())
-
-    # Ensure completed directory exists
-    completed_dir = _get_completed_dir()
-    completed_dir.mkdir(parents=True, exist_ok=True)
-
-    # Move the spec directory
-    new_path = completed_dir / slug
-    if new_path.exists():
-        raise ValueError(f"Spec '{slug}' already exists in completed/")
-
-    shutil.move(str(spec_dir), str(new_path))
-    return new_path
+    now = _now_iso()
+    return _move_spec(
+        slug,
+        _get_completed_dir(),
+        status="completed",
+        completed_at=now,
+        updated_at=now,
+    )
 
 
 def move_spec_to_abandoned(slug: str) -> Path:
@@ -478,21 +573,38 @@ def move_spec_to_abandoned(slug: str) -> Path:
     Updates the spec status to 'abandoned' and moves the directory.
     Returns the new path to the spec directory.
     """
+    return _move_spec(slug, _get_abandoned_dir(), status="abandoned")
+
+
+def _move_spec(slug: str, target_dir: Path, **updates) -> Path:
+    """Move a spec directory into target_dir and apply frontmatter updates.
+
+    The spec is read once, renamed into place, then written once at its new
+    location (updated_at is set as in update_spec).
+    """
     spec_dir = _find_spec_dir(slug)
     if spec_dir is None:
         raise ValueError(f"Spec '{slug}' not found")
 
-    # Update status before moving
-    update_spec(slug, status="abandoned")
+    new_path = target_dir / slug
+    if new_path.exists():
+        raise ValueError(f"Spec '{slug}' already exists in {target_dir.name}/")
 
-    # Ensure abandoned directory exists
-    abandoned_dir = _get_abandoned_dir()
-    abandoned_dir.mkdir(parents=True, exist_ok=True)
+    metadata, body = read_md_file(spec_dir / "spec.md")
+    metadata["updated_at"] = _now_iso()
+    metadata.update(updates)
 
-    # Move the spec directory
-    new_path = abandoned_dir / slug
-    if new_path.exists():
-        raise ValueError(f"Spec '{slug}' already exists in abandoned/")
+    # Ensure the target directory exists
+    target_dir.mkdir(parents=True, exist_ok=True)
 
-    shutil.move(str(spec_dir), str(new_path))
+    _forget_spec_dir(slug)
+    try:
+        os.rename(spec_dir, new_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Different filesystem: fall back to copy + delete
+        shutil.move(str(spec_dir), str(new_path))
+
+    write_md_file(new_path / "spec.md", metadata, body)
     return new_path
@@ -9,6 +9,10 @@ from pathlib import Path
 # Separator between spec body and comments section in markdown files
 SEPARATOR = "\n\n===\n***\n===\n\n"
 
+_SLUG_SEP_RE = re.compile(r"[\s\-]+")
+_SLUG_KEEP_RE = re.compile(r"[^a-z0-9_]")
+_SLUG_COLLAPSE_RE = re.compile(r"_+")
+
 
 def compute_content_hash(content: str) -> str:
     """
@@ -47,20 +51,25 @@ def extract_body_from_spec_file(file_path: Path) -> str:
         The body content (without frontmatter, before comments separator),
         or empty string if file doesn't exist
     """
-    if not file_path.exists():
+    try:
+        content = file_path.read_text()
+    except FileNotFoundError:
         return ""
 
-    content = file_path.read_text()
-
-    # Remove frontmatter if present
-    if content.startswith("---"):
-        match = re.match(r"^---\n.*?\n---\n?(.*)", content, re.DOTALL)
-        if match:
-            content = match.group(1)
+    # Remove frontmatter if present (closing --- found by plain string search,
+    # as in markdown.parse_frontmatter)
+    if content.startswith("---\n"):
+        end = content.find("\n---", 4)
+        if end >= 0:
+            body_start = end + 4
+            if content.startswith("\n", body_start):
+                body_start += 1
+            content = content[body_start:]
 
     # Remove comments section if present
-    if SEPARATOR in content:
-        content = content.split(SEPARATOR)[0]
+    separator_index = content.find(SEPARATOR)
+    if separator_index >= 0:
+        content = content[:separator_index]
 
     return content.strip()
 
@@ -103,13 +112,13 @@ def slugify(text: str) -> str:
     slug = clean_text.lower()
 
     # Replace spaces and common separators with underscores
-    slug = re.sub(r"[\s\-]+", "_", slug)
+    slug = _SLUG_SEP_RE.sub("_", slug)
 
     # Remove anything that isn't alphanumeric or underscore
-    slug = re.sub(r"[^a-z0-9_]", "", slug)
+    slug = _SLUG_KEEP_RE.sub("", slug)
 
     # Collapse multiple underscores
-    slug = re.sub(r"_+", "_", slug)
+    slug = _SLUG_COLLAPSE_RE.sub("_", slug)
 
     # Strip leading/trailing underscores
     slug = slug.strip("_")
@@ -8,15 +8,30 @@ Tasks are stored as:
 Each task has YAML frontmatter with metadata and markdown body.
 """
 
+import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from src.models import create_task_frontmatter
-from src.utils.markdown import read_md_file, slugify, write_md_file
+from src.utils.markdown import (
+    read_md_file,
+    read_md_files,
+    read_md_header,
+    read_md_headers,
+    slugify,
+    update_md_frontmatter,
+    write_md_file,
+)
 from src.utils.specs import get_spec_path
 
+_TASK_FILENAME_RE = re.compile(r"^(\d+)_(.+)\.md$")
+
+# Highest task number per tasks dir as (dir mtime_ns, number), see
+# get_next_task_number
+_task_number_cache: dict[Path, tuple[int, int]] = {}
+
 
 def _get_tasks_dir(spec_slug: str) -> Path:
     """Get the tasks directory for a spec.
@@ -36,7 +51,7 @@ def _parse_task_filename(filename: str) -> tuple[int, str] | None:
 
     Returns None if filename doesn't match expected pattern.
     """
-    match = re.match(r"^(\d+)_(.+)\.md$", filename)
+    match = _TASK_FILENAME_RE.match(filename)
     if not match:
         return None
     return int(match.group(1)), match.group(2)
@@ -47,6 +62,11 @@ def _make_task_filename(order: int, slug: str) -> str:
     return f"{order:02d}_{slug}.md"
 
 
+def _task_md_filename(task_filename: str) -> str:
+    """Return a task filename with its .md suffix, adding it if missing."""
+    return task_filename if task_filename.endswith(".md") else task_filename + ".md"
+
+
 def _task_to_dict(
     spec_slug: str, filename: str, metadata: dict, body: str
 ) -> dict[str, Any]:
@@ -66,23 +86,63 @@ def _task_to_dict(
     }
 
 
+def _scan_task_files(tasks_dir: Path) -> list[os.DirEntry]:
+    """List the .md file entries in a tasks directory ([] if it's missing).
+
+    Uses one scandir pass; DirEntry.is_file() needs no extra stat per entry.
+    """
+    try:
+        with os.scandir(tasks_dir) as it:
+            return [
+                entry
+                for entry in it
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 def get_next_task_number(spec_slug: str) -> int:
-    """Get next available task number prefix."""
-    tasks_dir = _get_tasks_dir(spec_slug)
+    """Get next available task number prefix.
 
-    if not tasks_dir.exists():
+    The highest number is cached per tasks directory and reused while the
+    directory's mtime is unchanged, so repeat calls cost a single stat.
+    """
+    tasks_dir = _get_tasks_dir(spec_slug)
+    try:
+        # Stat before scanning so a change made mid-scan invalidates the entry
+        dir_mtime_ns = os.stat(tasks_dir).st_mtime_ns
+    except FileNotFoundError:
         return 1
 
+    cached = _task_number_cache.get(tasks_dir)
+    if cached is not None and cached[0] == dir_mtime_ns:
+        return cached[1] + 1
+
     max_num = 0
-    for item in tasks_dir.iterdir():
-        if item.is_file() and item.suffix == ".md":
-            parsed = _parse_task_filename(item.name)
-            if parsed:
-                max_num = max(max_num, parsed[0])
+    for entry in _scan_task_files(tasks_dir):
+        parsed = _parse_task_filename(entry.name)
+        if parsed:
+            max_num = max(max_num, parsed[0])
 
+    _task_number_cache[tasks_dir] = (dir_mtime_ns, max_num)
     return max_num + 1
 
 
+def _note_task_number(tasks_dir: Path, dir_mtime_ns: int, order: int) -> None:
+    """Account for a task file just written to tasks_dir.
+
+    dir_mtime_ns is the directory's mtime from before the write. The cached
+    entry is only carried forward if nothing else changed the directory first.
+    """
+    cached = _task_number_cache.get(tasks_dir)
+    if cached is not None and cached[0] == dir_mtime_ns:
+        new_mtime_ns = os.stat(tasks_dir).st_mtime_ns
+        _task_number_cache[tasks_dir] = (new_mtime_ns, max(cached[1], order))
+    else:
+        _task_number_cache.pop(tasks_dir, None)
+
+
 def create_task(
     spec_slug: str, title: str, description: str, order: int | None = None
 ) -> Path:
@@ -106,7 +166,9 @@ def create_task(
     frontmatter = create_task_frontmatter(title)
     body = description
 
+    dir_mtime_ns = os.stat(tasks_dir).st_mtime_ns
     write_md_file(task_file, frontmatter.to_dict(), body)
+    _note_task_number(tasks_dir, dir_mtime_ns, order)
     return task_file
 
 
@@ -115,69 +177,82 @@ def get_task(spec_slug: str, task_filename: str) -> dict[str, Any] | None:
 
     task_filename should be like '01_my_task.md' or just '01_my_task'.
     """
-    if not task_filename.endswith(".md"):
-        task_filename = task_filename + ".md"
+    task_filename = _task_md_filename(task_filename)
 
-    task_file = _get_tasks_dir(spec_slug) / task_filename
-
-    if not task_file.exists():
+    try:
+        metadata, body = read_md_file(_get_tasks_dir(spec_slug) / task_filename)
+    except FileNotFoundError:
         return None
 
-    metadata, body = read_md_file(task_file)
     return _task_to_dict(spec_slug, task_filename, metadata, body)
 
 
-def list_tasks(spec_slug: str) -> list[dict[str, Any]]:
-    """List all tasks for a spec (sorted by order number)."""
-    tasks_dir = _get_tasks_dir(spec_slug)
+def list_tasks(spec_slug: str, include_body: bool = True) -> list[dict[str, Any]]:
+    """List all tasks for a spec (sorted by order number).
 
-    if not tasks_dir.exists():
-        return []
+    With include_body=False only the frontmatter is read and 'body' is "".
+    """
+    entries = [
+        entry
+        for entry in _scan_task_files(_get_tasks_dir(spec_slug))
+        if _parse_task_filename(entry.name)
+    ]
+    paths = [Path(entry.path) for entry in entries]
+
+    if include_body:
+        # Files missing from the cache are read concurrently
+        parsed = read_md_files(paths)
+    else:
+        parsed = read_md_headers(paths)
 
     tasks = []
-    for item in tasks_dir.iterdir():
-        if item.is_file() and item.suffix == ".md":
-            parsed = _parse_task_filename(item.name)
-            if parsed:
-                metadata, body = read_md_file(item)
-                tasks.append(_task_to_dict(spec_slug, item.name, metadata, body))
+    for entry, read in zip(entries, parsed):
+        if read is not None:
+            metadata, body = read
+            tasks.append(_task_to_dict(spec_slug, entry.name, metadata, body))
 
     # Sort by order number
     tasks.sort(key=lambda t: t.get("order", 0))
     return tasks
 
 
-def update_task(spec_slug: str, task_filename: str, **updates) -> None:
-    """Update task frontmatter fields."""
-    if not task_filename.endswith(".md"):
-        task_filename = task_filename + ".md"
+def _read_task_or_raise(spec_slug: str, task_filename: str) -> tuple[Path, dict, str]:
+    """Read a task by filename (with or without .md), return (file, metadata, body).
 
+    Raises ValueError if the task doesn't exist.
+    """
+    task_filename = _task_md_filename(task_filename)
     task_file = _get_tasks_dir(spec_slug) / task_filename
 
-    if not task_file.exists():
-        raise ValueError(f"Task '{task_filename}' not found")
-
-    metadata, body = read_md_file(task_file)
+    try:
+        metadata, body = read_md_file(task_file)
+    except FileNotFoundError:
+        raise ValueError(f"Task '{task_filename}' not found") from None
 
-    for key, value in updates.items():
-        metadata[key] = value
+    return task_file, metadata, body
 
-    metadata["updated_at"] = _now_iso()
-
-    write_md_file(task_file, metadata, body)
 
+def update_task(spec_slug: str, task_filename: str, **updates) -> None:
+    """Update task frontmatter fields.
 
-def update_task_body(spec_slug: str, task_filename: str, body: str) -> None:
-    """Update task body content."""
-    if not task_filename.endswith(".md"):
-        task_filename = task_filename + ".md"
+    Sets updated_at to the current time unless it is passed in updates.
+    """
+    task_filename = _task_md_filename(task_filename)
 
     task_file = _get_tasks_dir(spec_slug) / task_filename
+    if "updated_at" not in updates:
+        updates["updated_at"] = _now_iso()
 
-    if not task_file.exists():
-        raise ValueError(f"Task '{task_filename}' not found")
+    # One read and one write; the body is copied through unparsed when possible
+    try:
+        update_md_frontmatter(task_file, updates)
+    except FileNotFoundError:
+        raise ValueError(f"Task '{task_filename}' not found") from None
 
-    metadata, _ = read_md_file(task_file)
+
+def update_task_body(spec_slug: str, task_filename: str, body: str) -> None:
+    """Update task body content."""
+    task_file, metadata, _ = _read_task_or_raise(spec_slug, task_filename)
     metadata["updated_at"] = _now_iso()
 
     write_md_file(task_file, metadata, body)
@@ -188,37 +263,54 @@ def find_task_by_title(spec_slug: str, title: str) -> str | None:
 
     Returns the task filename or None if not found.
     """
-    task_list = list_tasks(spec_slug)
-    for task in task_list:
-        if title.lower() in task["title"].lower():
-            return task["filename"]
+    needle = title.lower()
+    for filename, task_title in _iter_task_titles(spec_slug):
+        if needle in task_title.lower():
+            return filename
     return None
 
 
+def _iter_task_titles(spec_slug: str) -> Iterator[tuple[str, str]]:
+    """Yield (filename, title) for a spec's tasks in order, reading lazily.
+
+    Only frontmatter is read, one file at a time, so callers that stop early
+    never open the remaining tasks.
+    """
+    numbered = []
+    for entry in _scan_task_files(_get_tasks_dir(spec_slug)):
+        parsed = _parse_task_filename(entry.name)
+        if parsed:
+            numbered.append((parsed[0], entry))
+
+    # Same order as list_tasks (stable sort on the order number)
+    numbered.sort(key=lambda item: item[0])
+    for _, entry in numbered:
+        # Skip a task deleted since the scan, as list_tasks does
+        try:
+            metadata = read_md_header(Path(entry.path))
+        except FileNotFoundError:
+            continue
+        yield entry.name, metadata["title"]
+
+
 # --- Task completion ---
 
 
 def complete_task(spec_slug: str, task_filename: str) -> None:
     """Mark task completed."""
+    now = _now_iso()
     update_task(
         spec_slug,
         task_filename,
         status="completed",
-        completed_at=_now_iso(),
+        completed_at=now,
+        updated_at=now,
     )
 
 
 def complete_task_with_notes(spec_slug: str, task_filename: str, notes: str) -> None:
     """Complete a task and append completion notes to body."""
-    if not task_filename.endswith(".md"):
-        task_filename = task_filename + ".md"
-
-    task_file = _get_tasks_dir(spec_slug) / task_filename
-
-    if not task_file.exists():
-        raise ValueError(f"Task '{task_filename}' not found")
-
-    metadata, body = read_md_file(task_file)
+    task_file, metadata, body = _read_task_or_raise(spec_slug, task_filename)
 
     # Append completion notes
     completion_section = f"\n\n## Completion Notes\n\n{notes}"
@@ -226,23 +318,26 @@ def complete_task_with_notes(spec_slug: str, task_filename: str, notes: str) ->
 
     # Update metadata
     metadata["status"] = "completed"
-    metadata["completed_at"] = _now_iso()
-    metadata["updated_at"] = _now_iso()
+    now = _now_iso()
+    metadata["completed_at"] = now
+    metadata["updated_at"] = now
 
     write_md_file(task_file, metadata, body)
 
 
 def delete_task(spec_slug: str, task_filename: str) -> None:
     """Delete task file."""
-    if not task_filename.endswith(".md"):
-        task_filename = task_filename + ".md"
-
-    task_file = _get_tasks_dir(spec_slug) / task_filename
+    task_filename = _task_md_filename(task_filename)
 
-    if not task_file.exists():
-        raise ValueError(f"Task '{task_filename}' not found")
+    tasks_dir = _get_tasks_dir(spec_slug)
+    task_file = tasks_dir / task_filename
 
-    task_file.unlink()
+    # The mtime may not move within the same clock tick, so drop the entry
+    _task_number_cache.pop(tasks_dir, None)
+    try:
+        task_file.unlink()
+    except FileNotFoundError:
+        raise ValueError(f"Task '{task_filename}' not found") from None
 
 
 def amend_task(spec_slug: str, task_filename: str, notes: str) -> None:
@@ -250,15 +345,7 @@ def amend_task(spec_slug: str, task_filename: str, notes: str) -> None:
 
     This enables iterative refinement: Amendments -> Completion -> Amendments -> ...
     """
-    if not task_filename.endswith(".md"):
-        task_filename = task_filename + ".md"
-
-    task_file = _get_tasks_dir(spec_slug) / task_filename
-
-    if not task_file.exists():
-        raise ValueError(f"Task '{task_filename}' not found")
-
-    metadata, body = read_md_file(task_file)
+    task_file, metadata, body = _read_task_or_raise(spec_slug, task_filename)
 
     amendment_section = f"\n\n## Amendments\n\n{notes}"
     body = body.rstrip() + amendment_section
@@ -276,12 +363,5 @@ def rename_task(spec_slug: str, task_filename: str, new_title: str) -> None:
 
     The filename/slug remains unchanged for stability.
     """
-    if not task_filename.endswith(".md"):
-        task_filename = task_filename + ".md"
-
-    task_file = _get_tasks_dir(spec_slug) / task_filename
-
-    if not task_file.exists():
-        raise ValueError(f"Task '{task_filename}' not found")
-
+    # update_task adds the .md suffix and raises ValueError if the task doesn't exist
     update_task(spec_slug, task_filename, title=new_title)
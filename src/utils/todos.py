@@ -7,12 +7,19 @@ Todos are stored as:
 Each todo has YAML frontmatter with metadata and optional markdown body.
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from env_settings import ENV_SETTINGS
-from src.utils.markdown import read_md_file, slugify, write_md_file
+from src.utils.markdown import (
+    read_md_file,
+    read_md_files,
+    read_md_headers,
+    slugify,
+    write_md_file,
+)
 
 
 def _get_todos_dir() -> Path:
@@ -79,30 +86,51 @@ def get_todo(slug: str) -> dict[str, Any] | None:
 
 
 def get_todo_by_issue_id(issue_id: int) -> dict[str, Any] | None:
-    """Find todo with matching issue_id."""
-    for todo in list_todos():
+    """Find todo with matching issue_id.
+
+    Only frontmatter is scanned; the body is read for the matching todo alone.
+    """
+    for todo in list_todos(include_body=False):
         if todo.get("issue_id") == issue_id:
-            return todo
+            return get_todo(todo["slug"])
     return None
 
 
-def list_todos(status: str | None = None) -> list[dict[str, Any]]:
+def list_todos(
+    status: str | None = None, include_body: bool = True
+) -> list[dict[str, Any]]:
     """List all todos, optionally filtered by status.
 
     Returns list of todo dicts sorted by created_at (newest first).
+    With include_body=False only the frontmatter is read and 'body' is "".
     """
-    todos_dir = _get_todos_dir()
-
-    if not todos_dir.exists():
+    try:
+        with os.scandir(_get_todos_dir()) as it:
+            # DirEntry.is_file() is answered from the directory listing itself;
+            # a bare ".md" has no suffix as a Path, so it is not a todo
+            todo_files = [
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(".md")
+                and entry.name != ".md"
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
 
+    if include_body:
+        # Files missing from the cache are read concurrently
+        parsed = read_md_files(todo_files)
+    else:
+        parsed = read_md_headers(todo_files)
+
     todos = []
-    for todo_file in todos_dir.iterdir():
-        if not todo_file.is_file() or todo_file.suffix != ".md":
+    for todo_file, read in zip(todo_files, parsed):
+        if read is None:
             continue
 
         slug = todo_file.stem
-        metadata, body = read_md_file(todo_file)
+        metadata, body = read
 
         if status is not None and metadata.get("status") != status:
             continue
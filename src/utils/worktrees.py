@@ -11,11 +11,10 @@ Directory structure:
     └── fix_sync/                      # Worktree on 'dev-user-fix_sync' branch
 """
 
+import os
 from pathlib import Path
 from typing import NamedTuple
 
-from git import Repo
-
 
 class WorktreeInfo(NamedTuple):
     """Information about a git worktree."""
@@ -25,6 +24,11 @@ class WorktreeInfo(NamedTuple):
     is_main: bool
 
 
+# Parsed `git worktree list` per resolved main repo path, stored with the
+# _worktree_state it was read under, see list_worktrees
+_worktree_list_cache: dict[Path, tuple[tuple, list[WorktreeInfo]]] = {}
+
+
 def is_worktree(path: Path) -> bool:
     """Check if the given path is a git worktree (not the main repo).
 
@@ -82,6 +86,8 @@ def create_worktree(main_repo_path: Path, slug: str, branch_name: str) -> Path:
 
     Returns the path to the created worktree.
     """
+    from git import Repo
+
     repo = Repo(main_repo_path)
     worktree_path = get_worktree_path(main_repo_path, slug)
 
@@ -100,6 +106,8 @@ def remove_worktree(main_repo_path: Path, slug: str, force: bool = False) -> boo
 
     Returns True if removed, False if worktree didn't exist.
     """
+    from git import Repo
+
     repo = Repo(main_repo_path)
     worktree_path = get_worktree_path(main_repo_path, slug)
 
@@ -120,8 +128,18 @@ def list_worktrees(main_repo_path: Path) -> list[WorktreeInfo]:
     Returns list of WorktreeInfo with path, branch, and whether it's the main repo.
     Uses resolve() to handle symlinks consistently.
     """
-    repo = Repo(main_repo_path)
     resolved_main = main_repo_path.resolve()
+
+    # Reuse the last listing while no worktree was added, removed, moved or
+    # switched branch, instead of spawning git again
+    state = _worktree_state(resolved_main / ".git")
+    cached = _worktree_list_cache.get(resolved_main)
+    if state is not None and cached is not None and cached[0] == state:
+        return list(cached[1])
+
+    from git import Repo
+
+    repo = Repo(main_repo_path)
     worktrees = []
 
     output = repo.git.worktree("list", "--porcelain")
@@ -156,7 +174,41 @@ def list_worktrees(main_repo_path: Path) -> list[WorktreeInfo]:
             )
         )
 
-    return worktrees
+    if state is not None:
+        _worktree_list_cache[resolved_main] = (state, worktrees)
+    return list(worktrees)
+
+
+def _worktree_state(git_dir: Path) -> tuple | None:
+    """Signature of the files `git worktree list` output is derived from.
+
+    Covers the main HEAD plus each linked worktree's HEAD and gitdir file.
+    Git rewrites these through a lock file and rename, so any change gives a
+    new inode. Returns None when git_dir is not a directory with a HEAD; the
+    caller then always asks git.
+    """
+    try:
+        head = os.stat(os.path.join(git_dir, "HEAD"))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    state = [("", head.st_mtime_ns, head.st_ino)]
+
+    try:
+        with os.scandir(os.path.join(git_dir, "worktrees")) as it:
+            admin_dirs = sorted(entry.path for entry in it if entry.is_dir())
+    except FileNotFoundError:
+        admin_dirs = []
+
+    for admin_dir in admin_dirs:
+        for name in ("HEAD", "gitdir"):
+            try:
+                st = os.stat(os.path.join(admin_dir, name))
+            except FileNotFoundError:
+                state.append((admin_dir, name))
+                continue
+            state.append((admin_dir, name, st.st_mtime_ns, st.st_ino))
+
+    return tuple(state)
 
 
 def get_worktree_for_spec(main_repo_path: Path, slug: str) -> WorktreeInfo | None:
@@ -92,6 +92,46 @@ class TestDocsUtilities:
                     loaded = load_doc_hashes()
                     assert loaded == test_hashes
 
+    def test_legacy_json_hashes_are_migrated(self, tmp_path):
+        """Test that hashes from the old JSON files seed the SQLite store."""
+        from src.utils.docs import _get_chunk_hashes, load_doc_hashes, set_doc_hash
+
+        (tmp_path / ".doc_hashes.json").write_text(json.dumps({"old_doc": "abc"}))
+        (tmp_path / ".doc_chunks.json").write_text(json.dumps({"old_doc": 2}))
+
+        with patch("src.utils.docs._get_data_dir", return_value=tmp_path):
+            assert load_doc_hashes() == {"old_doc": "abc"}
+            assert _get_chunk_hashes("old_doc") == ["", ""]
+
+            set_doc_hash("new_doc", "def")
+            assert load_doc_hashes() == {"old_doc": "abc", "new_doc": "def"}
+
+        assert (tmp_path / "doc_hashes.db").exists()
+
+    def test_hash_store_connection_is_reused(self, tmp_path):
+        """Test that the hash store is opened once and shared by every call."""
+        import sqlite3
+
+        from src.utils.docs import (
+            _get_chunk_hashes,
+            _set_chunk_hashes,
+            load_doc_hashes,
+            reset_hashes_cache,
+            set_doc_hash,
+        )
+
+        with patch("src.utils.docs._get_data_dir", return_value=tmp_path):
+            with patch(
+                "src.utils.docs.sqlite3.connect", wraps=sqlite3.connect
+            ) as mock_connect:
+                set_doc_hash("doc", "abc")
+                _set_chunk_hashes("doc", ["x", "y"])
+                assert load_doc_hashes() == {"doc": "abc"}
+                assert _get_chunk_hashes("doc") == ["x", "y"]
+
+        mock_connect.assert_called_once()
+        reset_hashes_cache()
+
     def test_list_doc_files(self, tmp_path):
         """Test listing document files."""
         from src.utils.docs import list_doc_files
@@ -127,6 +167,22 @@ class TestDocsUtilities:
             missing = read_doc("nonexistent")
             assert missing is None
 
+    def test_read_doc_bytes(self, tmp_path):
+        """Test reading raw document bytes and hashing them."""
+        from src.utils.docs import compute_bytes_hash, compute_file_hash, read_doc_bytes
+
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        doc_path = docs_dir / "test_doc.md"
+        doc_path.write_bytes("# Tëst\n".encode())
+
+        with patch("src.utils.docs._get_docs_dir", return_value=docs_dir):
+            raw = read_doc_bytes("test_doc")
+            assert raw == "# Tëst\n".encode()
+            assert compute_bytes_hash(raw) == compute_file_hash(doc_path)
+
+            assert read_doc_bytes("nonexistent") is None
+
     def test_read_write_summary(self, tmp_path):
         """Test reading and writing summaries."""
         from src.utils.docs import read_summary, write_summary
@@ -263,6 +319,44 @@ class TestDocsUtilities:
         assert ok is True
         assert missing == []
 
+    def test_collection_name_follows_config_changes(self, tmp_path):
+        """Test that the cached config is re-read when the file changes."""
+        from src.utils.docs import _get_collection_name, reload_config
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[project]\nname = "test_project"\n')
+
+        with patch("src.utils.docs.ENV_SETTINGS") as mock_settings:
+            mock_settings.config_file = config_file
+            assert _get_collection_name() == "test_project_docs"
+
+            config_file.write_text('[project]\nname = "other-project"\n')
+            os.utime(config_file, ns=(0, 0))
+            reload_config()
+            assert _get_collection_name() == "other_project_docs"
+
+    def test_get_collection_is_cached(self, tmp_path):
+        """Test that the Chroma client and collection are opened once."""
+        from src.utils.docs import get_collection, reset_chroma_cache
+
+        reset_chroma_cache()
+        with patch("chromadb.PersistentClient") as mock_client:
+            with patch("src.utils.docs._get_chroma_dir", return_value=tmp_path):
+                with patch("src.utils.docs._get_embedding_function"):
+                    with patch("src.utils.docs.ensure_docs_dirs"):
+                        with patch(
+                            "src.utils.docs._read_config",
+                            return_value={"project": {"name": "cached"}},
+                        ):
+                            first = get_collection()
+                            second = get_collection()
+
+        assert first is second
+        mock_client.assert_called_once_with(path=str(tmp_path))
+        client = mock_client.return_value
+        client.get_or_create_collection.assert_called_once()
+        reset_chroma_cache()
+
 
 class TestDocsChunking:
     """Tests for document chunking."""
@@ -290,13 +384,211 @@ Content for section two.
             assert chunk.content
             assert chunk.meta_data.get("doc_slug") == "test_doc"
 
+    def test_fast_chunking_matches_markdown_chunking(self):
+        """Test that the fast chunker produces the same chunks as MarkdownChunking."""
+        from agno.knowledge.chunking.markdown import MarkdownChunking
+        from agno.knowledge.document import Document
+
+        from src.utils.docs import _fast_markdown_chunk
+
+        long_section = "\n\n".join(f"Paragraph {i} " + "word " * 40 for i in range(30))
+        content = f"""Preamble before any heading.
+
+# Main Title
+
+Intro.
+
+## Big Section
+
+{long_section}
+
+### Nested heading stays in its section
+
+{"x" * 700}
+
+## Small Section
+
+Done.
+"""
+        chunker = MarkdownChunking(chunk_size=500, overlap=50, split_on_headings=2)
+        expected = chunker.chunk(
+            Document(content=content, id="doc", name="doc", meta_data={})
+        )
+
+        chunks = _fast_markdown_chunk(
+            content, chunk_size=500, overlap=50, split_on_headings=2
+        )
+        assert chunks == [doc.content for doc in expected]
+
+
+class TestDocsIndexing:
+    """Tests for index_document with a mocked collection."""
+
+    def test_index_document_upserts_in_batches(self, tmp_path):
+        """Test that large documents are upserted in bounded batches."""
+        from unittest.mock import MagicMock
+
+        from src.utils.docs import UPSERT_BATCH_SIZE, index_document
+
+        chunk_total = UPSERT_BATCH_SIZE * 2 + 5
+        chunks = [MagicMock(content=f"chunk {i}") for i in range(chunk_total)]
+        for chunk in chunks:
+            chunk.name = None
+        collection = MagicMock()
+
+        with patch("src.utils.docs.chunk_document", return_value=chunks):
+            with patch("src.utils.docs.get_collection", return_value=collection):
+                with patch("src.utils.docs._get_data_dir", return_value=tmp_path):
+                    with patch("src.utils.docs.ensure_docs_dirs"):
+                        assert index_document("big_doc", "ignored") == chunk_total
+
+        assert collection.upsert.call_count == 3
+        batch_sizes = [len(c.kwargs["ids"]) for c in collection.upsert.call_args_list]
+        assert batch_sizes == [UPSERT_BATCH_SIZE, UPSERT_BATCH_SIZE, 5]
+        last_ids = collection.upsert.call_args_list[-1].kwargs["ids"]
+        assert last_ids[-1] == f"big_doc_{chunk_total - 1}"
+
+    def test_delete_doc_from_index_uses_recorded_chunk_ids(self, tmp_path):
+        """Test that deleting an indexed doc skips the metadata scan."""
+        from unittest.mock import MagicMock
+
+        from src.utils.docs import delete_doc_from_index, index_document
+
+        chunks = [MagicMock(content=f"chunk {i}") for i in range(3)]
+        for chunk in chunks:
+            chunk.name = None
+        collection = MagicMock()
+
+        with patch("src.utils.docs.chunk_document", return_value=chunks):
+            with patch("src.utils.docs.get_collection", return_value=collection):
+                with patch("src.utils.docs._get_data_dir", return_value=tmp_path):
+                    with patch("src.utils.docs.ensure_docs_dirs"):
+                        index_document("small_doc", "ignored")
+                        collection.reset_mock()
+                        assert delete_doc_from_index("small_doc") == 3
+
+        collection.get.assert_not_called()
+        collection.delete.assert_called_once_with(
+            ids=["small_doc_0", "small_doc_1", "small_doc_2"]
+        )
+
+    def test_reindex_upserts_only_changed_chunks(self, tmp_path):
+        """Test that unchanged chunks are not re-embedded and stale ones are removed."""
+        from unittest.mock import MagicMock
+
+        from src.utils.docs import index_document
+
+        def make_chunks(*contents):
+            chunks = [MagicMock(content=content) for content in contents]
+            for chunk in chunks:
+                chunk.name = None
+            return chunks
+
+        collection = MagicMock()
+        collection.get.side_effect = lambda ids=None, where=None, include=None: {
+            "ids": ids or []
+        }
+
+        with patch("src.utils.docs.get_collection", return_value=collection):
+            with patch("src.utils.docs._get_data_dir", return_value=tmp_path):
+                with patch("src.utils.docs.ensure_docs_dirs"):
+                    with patch(
+                        "src.utils.docs.chunk_document",
+                        return_value=make_chunks("a", "b", "c"),
+                    ):
+                        index_document("doc", "ignored")
+
+                    collection.reset_mock()
+                    with patch(
+                        "src.utils.docs.chunk_document",
+                        return_value=make_chunks("a", "B"),
+                    ):
+                        assert index_document("doc", "ignored") == 2
+
+        collection.upsert.assert_called_once()
+        assert collection.upsert.call_args.kwargs["ids"] == ["doc_1"]
+        collection.delete.assert_called_once_with(ids=["doc_2"])
+
+    def test_reindex_without_chunk_hashes_removes_old_chunks(self, tmp_path):
+        """Test that a doc indexed before chunk hashes existed loses stale chunks."""
+        from unittest.mock import MagicMock
+
+        from src.utils.docs import _get_chunk_hashes, index_document
+
+        chunks = [MagicMock(content=content) for content in ("a", "b")]
+        for chunk in chunks:
+            chunk.name = None
+        old_ids = ["legacy_doc_0", "legacy_doc_1", "legacy_doc_2", "legacy_doc_3"]
+        collection = MagicMock()
+        collection.get.return_value = {"ids": old_ids}
+
+        with patch("src.utils.docs.chunk_document", return_value=chunks):
+            with patch("src.utils.docs.get_collection", return_value=collection):
+                with patch("src.utils.docs._get_data_dir", return_value=tmp_path):
+                    with patch("src.utils.docs.ensure_docs_dirs"):
+                        assert index_document("legacy_doc", "ignored") == 2
+                        assert len(_get_chunk_hashes("legacy_doc")) == 2
+
+        collection.get.assert_called_once_with(
+            where={"doc_slug": "legacy_doc"}, include=[]
+        )
+        collection.delete.assert_called_once_with(ids=old_ids)
+        assert [name for name, _, _ in collection.method_calls] == [
+            "get",
+            "delete",
+            "upsert",
+        ]
+        assert collection.upsert.call_args.kwargs["ids"] == [
+            "legacy_doc_0",
+            "legacy_doc_1",
+        ]
+
+    def test_search_docs_maps_query_results(self):
+        """Test that query results are flattened into result dicts."""
+        from unittest.mock import MagicMock
+
+        from src.utils.docs import search_docs
+
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["guide_0", "guide_1"]],
+            "documents": [["first", "second"]],
+            "metadatas": [
+                [
+                    {"doc_slug": "guide", "chunk_index": 0, "heading": "Intro"},
+                    {"doc_slug": "guide", "chunk_index": 1},
+                ]
+            ],
+            "distances": [[0.1, 0.4]],
+        }
+
+        with patch("src.utils.docs.get_collection", return_value=collection):
+            results = search_docs("query", n_results=2)
+
+        assert results == [
+            {
+                "content": "first",
+                "doc_slug": "guide",
+                "chunk_index": 0,
+                "heading": "Intro",
+                "distance": 0.1,
+            },
+            {
+                "content": "second",
+                "doc_slug": "guide",
+                "chunk_index": 1,
+                "heading": "",
+                "distance": 0.4,
+            },
+        ]
+
 
 class TestDocsDelete:
     """Tests for document deletion."""
 
     def test_delete_doc(self, tmp_path):
         """Test deleting a document and its associated files."""
-        from src.utils.docs import delete_doc
+        from src.utils.docs import delete_doc, load_doc_hashes
 
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
@@ -330,8 +622,7 @@ class TestDocsDelete:
                                 assert not doc_file.exists()
                                 assert not summary_file.exists()
 
-                                loaded_hashes = json.loads(hashes_file.read_text())
-                                assert "to_delete" not in loaded_hashes
+                                assert "to_delete" not in load_doc_hashes()
 
     def test_delete_nonexistent_doc(self, tmp_path):
         """Test deleting a document that doesn't exist."""
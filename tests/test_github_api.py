@@ -3,13 +3,25 @@ Tests for GitHub API utility functions.
 """
 
 import time
+from unittest.mock import MagicMock
 
 import pytest
+from github import GithubException
+from github.Issue import Issue
 
 from src.utils.github.api import (
+    STATUS_LABELS,
+    clear_issue_cache,
+    clear_pull_request_cache,
     close_issue_with_comment,
+    ensure_status_labels,
     get_pull_request_by_url,
     is_pr_merged,
+    iter_repo_issues,
+    list_merge_ready_prs,
+    list_repo_issues,
+    sync_status_labels,
+    update_github_issue,
 )
 
 
@@ -181,3 +193,180 @@ def test_is_pr_merged_invalid_url(test_repo):
     """Test is_pr_merged returns False for invalid URLs."""
     assert is_pr_merged(test_repo, "invalid-url") is False
     assert is_pr_merged(test_repo, "https://github.com/owner/repo/pull/99999") is False
+
+
+def test_list_merge_ready_prs_uses_single_graphql_query():
+    """Test that merge-ready PRs and their checks come from one GraphQL query."""
+    repo = MagicMock()
+    repo.full_name = "owner/repo"
+    node = {
+        "number": 7,
+        "title": "[Complete]: Add feature",
+        "body": "Implements the spec.\n\nCloses #3",
+        "url": "https://github.com/owner/repo/pull/7",
+        "headRefName": "dev-add-feature",
+        "mergeable": "MERGEABLE",
+        "author": {"login": "alice"},
+        "commits": {"nodes": [{"commit": {"statusCheckRollup": {"state": "SUCCESS"}}}]},
+    }
+    other = dict(node, number=8, title="Work in progress")
+    repo.requester.graphql_query.return_value = (
+        {},
+        {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [node, other],
+                    }
+                }
+            }
+        },
+    )
+
+    prs = list_merge_ready_prs(repo, base_branch="dev")
+
+    repo.requester.graphql_query.assert_called_once()
+    repo.get_pulls.assert_not_called()
+    assert prs == [
+        {
+            "number": 7,
+            "title": "Add feature",
+            "author": "alice",
+            "issue_number": 3,
+            "checks_passing": True,
+            "mergeable": True,
+            "html_url": "https://github.com/owner/repo/pull/7",
+            "head_branch": "dev-add-feature",
+        }
+    ]
+
+
+def test_ensure_status_labels_creates_only_missing_labels():
+    """Test that labels are listed once and only missing ones are created."""
+    repo = MagicMock()
+    existing = [MagicMock() for _ in range(2)]
+    existing[0].name = STATUS_LABELS["todo"]["label"]
+    existing[1].name = STATUS_LABELS["active"]["label"]
+    repo.get_labels.return_value = existing
+
+    def create_label(name, color, description):
+        # Another client created this one between listing and creating
+        if name == STATUS_LABELS["archived"]["label"]:
+            raise GithubException(422, {"message": "Validation Failed"}, None)
+
+    repo.create_label.side_effect = create_label
+
+    ensure_status_labels(repo)
+
+    repo.get_labels.assert_called_once()
+    repo.get_label.assert_not_called()
+    created = {call.args[0] for call in repo.create_label.call_args_list}
+    assert created == {
+        config["label"]
+        for status, config in STATUS_LABELS.items()
+        if status not in ("todo", "active")
+    }
+
+
+@pytest.mark.parametrize(
+    "pr_url",
+    [
+        "https://github.com/owner/repo/pull/42",
+        "https://github.com/owner/repo/pull/42/",
+        "https://github.com/owner/repo/pull/42/files",
+        "https://github.com/owner/repo/pull/42?merge=1",
+        "https://github.com/owner/repo/pull/42#issuecomment-1",
+        "https://github.example.com/owner/repo/pull/42",
+    ],
+)
+def test_get_pull_request_by_url_parses_pr_number(pr_url):
+    """Test that the PR number is extracted from common PR URL variants."""
+    clear_pull_request_cache()
+    repo = MagicMock()
+    repo.full_name = "owner/repo"
+
+    assert get_pull_request_by_url(repo, pr_url) is repo.get_pull.return_value
+    repo.get_pull.assert_called_once_with(42)
+
+
+def test_issue_helpers_fetch_each_issue_once():
+    """Test that consecutive helpers on the same issue share one fetch."""
+    clear_issue_cache()
+    repo = MagicMock()
+    repo.full_name = "owner/repo"
+
+    update_github_issue(repo, 5, body="New body")
+    sync_status_labels(repo, 5, "active", current_labels=["bug"])
+
+    repo.get_issue.assert_called_once_with(number=5)
+    issue = repo.get_issue.return_value
+    issue.edit.assert_called_with(labels=["bug", STATUS_LABELS["active"]["label"]])
+
+
+def test_list_repo_issues_skips_prs_without_completing_issues():
+    """Test that PRs are filtered from the listed JSON without extra requests."""
+    requester = MagicMock()
+    url = "https://api.github.com/repos/owner/repo/issues/"
+    listed = [
+        Issue(requester, {}, {"number": 2, "url": f"{url}2"}, completed=False),
+        Issue(
+            requester,
+            {},
+            {"number": 1, "url": f"{url}1", "pull_request": {"url": "..."}},
+            completed=False,
+        ),
+    ]
+    repo = MagicMock()
+    repo.full_name = "owner/repo"
+    repo.get_issues.return_value = listed
+
+    issues = list_repo_issues(repo, state="all")
+
+    assert [issue.number for issue in issues] == [2]
+    requester.requestJsonAndCheck.assert_not_called()
+
+
+def test_iter_repo_issues_stops_when_consumer_stops():
+    """Test that breaking out of iter_repo_issues stops pulling issues."""
+    pulled = []
+
+    def listing():
+        for number in range(1, 100):
+            pulled.append(number)
+            issue = MagicMock(number=number)
+            issue._rawData = {"number": number}
+            yield issue
+
+    repo = MagicMock()
+    repo.full_name = "owner/repo"
+    repo.get_issues.return_value = listing()
+
+    first = next(iter_repo_issues(repo, state="all"))
+
+    assert first.number == 1
+    assert pulled == [1]
+
+
+def test_list_merge_ready_prs_rest_fallback_requests_status_directly():
+    """Test that the REST fallback makes one status request per PR."""
+    repo = MagicMock()
+    repo.full_name = "owner/repo"
+    repo.url = "https://api.github.com/repos/owner/repo"
+    repo.requester.graphql_query.side_effect = GithubException(502, None, None)
+    repo.requester.requestJsonAndCheck.return_value = (
+        {},
+        {"state": "failure", "total_count": 2},
+    )
+    pr = MagicMock(number=9, title="[Complete]: Fix bug", body="Closes #4")
+    pr.head.sha = "abc123"
+    repo.get_pulls.return_value = [pr]
+
+    prs = list_merge_ready_prs(repo)
+
+    repo.get_commit.assert_not_called()
+    repo.requester.requestJsonAndCheck.assert_called_once_with(
+        "GET", "https://api.github.com/repos/owner/repo/commits/abc123/status"
+    )
+    assert prs[0]["checks_passing"] is False
+    assert prs[0]["issue_number"] == 4
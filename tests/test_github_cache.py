@@ -0,0 +1,78 @@
+"""
+Tests for the GitHub ETag response cache.
+"""
+
+import time
+from unittest.mock import patch
+
+from github import Github
+from github.Requester import Requester
+
+from src.utils.github.cache import CachingRequester, EtagCache
+
+
+def _make_requester(tmp_path):
+    cache = EtagCache(tmp_path / "gh_etag.sqlite")
+    return CachingRequester(**Github().requester.kwargs, etag_cache=cache)
+
+
+def test_not_modified_response_is_served_from_cache(tmp_path):
+    """Test that a 304 is answered with the stored body and validators are sent."""
+    sent_headers = []
+    responses = [
+        (200, {"etag": '"abc"', "x-ratelimit-remaining": "99"}, '{"number": 1}'),
+        (304, {"x-ratelimit-remaining": "98"}, ""),
+    ]
+
+    def fake_request_json(self, verb, url, parameters=None, headers=None, *args):
+        sent_headers.append(dict(headers or {}))
+        return responses[len(sent_headers) - 1]
+
+    requester = _make_requester(tmp_path)
+    with patch.object(Requester, "requestJson", fake_request_json):
+        first = requester.requestJson("GET", "/repos/owner/repo/issues/1")
+        second = requester.requestJson("GET", "/repos/owner/repo/issues/1")
+
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"abc"'
+    assert first[2] == second[2] == '{"number": 1}'
+    assert second[0] == 200
+    assert second[1]["x-ratelimit-remaining"] == "98"
+
+
+def test_non_get_requests_bypass_cache(tmp_path):
+    """Test that writes are never cached or sent with validators."""
+    sent_headers = []
+
+    def fake_request_json(self, verb, url, parameters=None, headers=None, *args):
+        sent_headers.append(dict(headers or {}))
+        return 200, {"etag": '"abc"'}, "{}"
+
+    requester = _make_requester(tmp_path)
+    with patch.object(Requester, "requestJson", fake_request_json):
+        requester.requestJson("PATCH", "/repos/owner/repo/issues/1", input={})
+        requester.requestJson("PATCH", "/repos/owner/repo/issues/1", input={})
+
+    assert all("If-None-Match" not in headers for headers in sent_headers)
+
+
+def test_low_rate_limit_pauses_until_reset(tmp_path):
+    """Test that a nearly exhausted rate limit sleeps until the window resets."""
+    reset_at = time.time() + 30
+
+    def fake_request_json(self, verb, url, parameters=None, headers=None, *args):
+        return (
+            200,
+            {"x-ratelimit-remaining": "10", "x-ratelimit-reset": str(int(reset_at))},
+            "{}",
+        )
+
+    requester = _make_requester(tmp_path)
+    with (
+        patch.object(Requester, "requestJson", fake_request_json),
+        patch("src.utils.github.cache.time.sleep") as mock_sleep,
+    ):
+        requester.requestJson("GET", "/repos/owner/repo/issues/1")
+
+    mock_sleep.assert_called_once()
+    assert 0 < mock_sleep.call_args.args[0] <= 32
@@ -269,3 +269,87 @@ def test_multiple_users_same_day(initialized_mem):
     # Each user should have their own log
     usernames = {log["username"] for log in all_logs}
     assert usernames == {"alice", "bob", "charlie"}
+
+
+def test_list_logs_reads_only_newest_files(initialized_mem, monkeypatch):
+    """Test that list_logs picks the newest logs from filenames before reading."""
+    from src.utils.markdown import write_md_file
+
+    logs_dir = initialized_mem / ".mem" / "logs"
+    for day in range(1, 6):
+        created_at = datetime(2025, 1, day, 9, 30, 0)
+        write_md_file(
+            logs_dir / f"alice_202501{day:02d}_093000_session.md",
+            {"created_at": created_at.isoformat(), "username": "alice"},
+            "body",
+        )
+
+    read_paths = []
+    original_read = logs.read_md_file
+
+    def counting_read(path):
+        read_paths.append(path.name)
+        return original_read(path)
+
+    monkeypatch.setattr(logs, "read_md_file", counting_read)
+
+    recent = logs.list_logs(limit=2)
+
+    assert [log["filename"] for log in recent] == [
+        "alice_20250105_093000_session.md",
+        "alice_20250104_093000_session.md",
+    ]
+    assert len(read_paths) == 2
+
+
+def test_list_logs_limit_keeps_newer_legacy_log(initialized_mem):
+    """Test that a legacy log created late in its day isn't cut off by limit."""
+    from src.utils.markdown import write_md_file
+
+    logs_dir = initialized_mem / ".mem" / "logs"
+    for filename, created_at in [
+        ("alice_20250105_093000_session.md", datetime(2025, 1, 5, 9, 30, 0)),
+        ("alice_20250104_120000_session.md", datetime(2025, 1, 4, 12, 0, 0)),
+        ("alice_20250104_100000_session.md", datetime(2025, 1, 4, 10, 0, 0)),
+        # Legacy name sorts at midnight but was created late that day
+        ("bob_20250104_session.md", datetime(2025, 1, 4, 23, 0, 0)),
+    ]:
+        write_md_file(
+            logs_dir / filename,
+            {"created_at": created_at.isoformat(), "username": filename.split("_")[0]},
+            "body",
+        )
+
+    recent = logs.list_logs(limit=2)
+
+    assert [log["filename"] for log in recent] == [
+        "alice_20250105_093000_session.md",
+        "bob_20250104_session.md",
+    ]
+    assert recent == logs.list_logs(limit=50)[:2]
+
+
+def test_log_mutations_raise_for_missing_log(initialized_mem):
+    """Test that mutating a missing log raises ValueError."""
+    filename = "alice_20250101_093000_session.md"
+
+    with pytest.raises(ValueError, match="not found"):
+        logs.update_log(filename, spec_slug="test_spec")
+    with pytest.raises(ValueError, match="not found"):
+        logs.update_log_body(filename, "body")
+    with pytest.raises(ValueError, match="not found"):
+        logs.append_to_log(filename, "Notes", "content")
+    with pytest.raises(ValueError, match="not found"):
+        logs.delete_log(filename)
+
+
+def test_update_log_edits_frontmatter_in_place(initialized_mem):
+    """Test that scalar updates only rewrite the changed frontmatter lines."""
+    log_path = logs.create_log()
+    original = log_path.read_text()
+
+    logs.update_log(log_path.name, spec_slug="test_spec")
+
+    header, delimiter, body = original.partition("\n---")
+    assert log_path.read_text() == f"{header}\nspec_slug: test_spec{delimiter}{body}"
+    assert logs.get_log_by_filename(log_path.name)["spec_slug"] == "test_spec"
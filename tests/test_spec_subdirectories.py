@@ -5,6 +5,8 @@ Tests for spec subdirectory functionality:
 - get_spec finds specs in all locations
 """
 
+import os
+
 import pytest
 
 from src.utils import specs, tasks
@@ -261,3 +263,157 @@ def test_delete_spec_works_for_moved_specs(initialized_mem):
 
     # Verify it's gone
     assert specs.get_spec(spec_slug) is None
+
+
+def test_get_spec_notices_spec_removed_outside_mem(initialized_mem):
+    """Test that a cached spec location is re-checked before it is used."""
+    import shutil
+
+    specs.create_spec("Externally Removed")
+    spec_slug = "externally_removed"
+    assert specs.get_spec(spec_slug) is not None
+
+    shutil.rmtree(initialized_mem / ".mem" / "specs" / spec_slug)
+
+    assert specs.get_spec(spec_slug) is None
+
+
+def test_list_specs_without_body_matches_frontmatter(initialized_mem):
+    """Test that header-only listing returns the same metadata without bodies."""
+    specs.create_spec("Header Only")
+
+    full = specs.list_specs()
+    headers = specs.list_specs(include_body=False)
+
+    assert [s["slug"] for s in headers] == [s["slug"] for s in full]
+    assert headers[0]["body"] == ""
+    assert {**headers[0], "body": full[0]["body"]} == full[0]
+
+
+def test_get_spec_by_issue_id_follows_issue_changes(initialized_mem):
+    """Test that issue lookups stay correct as issues are linked and specs move."""
+    specs.create_spec("First Linked")
+    specs.create_spec("Second Linked")
+    specs.update_spec_issue_info("first_linked", 11, "https://example.com/11")
+
+    assert specs.get_spec_by_issue_id(11)["slug"] == "first_linked"
+    assert specs.get_spec_by_issue_id(12) is None
+
+    specs.update_spec_issue_info("second_linked", 12, "https://example.com/12")
+    assert specs.get_spec_by_issue_id(12)["slug"] == "second_linked"
+
+    # Only specs in the root directory are matched
+    specs.move_spec_to_completed("first_linked")
+    assert specs.get_spec_by_issue_id(11) is None
+
+
+def test_list_specs_reads_many_specs_in_order(initialized_mem):
+    """Test that listing enough specs to read concurrently keeps each body."""
+    from src.utils.markdown import _parse_cache
+
+    for i in range(10):
+        specs.create_spec(f"Bulk Spec {i}")
+        specs.update_spec_body(f"bulk_spec_{i}", f"Body {i}")
+    _parse_cache.clear()
+
+    listed = specs.list_specs()
+
+    assert len(listed) == 10
+    for spec in listed:
+        assert spec["body"] == f"Body {spec['slug'].rsplit('_', 1)[1]}"
+
+
+def test_find_task_by_title_stops_at_first_match(initialized_mem, monkeypatch):
+    """Test that title lookup returns the lowest-numbered match and stops there."""
+    specs.create_spec("Task Lookup")
+    spec_slug = "task_lookup"
+    tasks.create_task(spec_slug, "Write docs", "First")
+    tasks.create_task(spec_slug, "Write tests", "Second")
+    tasks.create_task(spec_slug, "Ship release", "Third")
+
+    read_names = []
+    original_read = tasks.read_md_header
+
+    def counting_read(path):
+        read_names.append(path.name)
+        return original_read(path)
+
+    monkeypatch.setattr(tasks, "read_md_header", counting_read)
+
+    assert tasks.find_task_by_title(spec_slug, "write") == "01_write_docs.md"
+    assert read_names == ["01_write_docs.md"]
+    assert tasks.find_task_by_title(spec_slug, "RELEASE") == "03_ship_release.md"
+    assert tasks.find_task_by_title(spec_slug, "missing") is None
+
+
+def test_next_task_number_tracks_created_and_deleted_tasks(initialized_mem):
+    """Test that task numbering stays correct across quick creates and deletes."""
+    specs.create_spec("Numbering")
+    spec_slug = "numbering"
+
+    for i in range(1, 4):
+        path = tasks.create_task(spec_slug, f"Step {i}", "")
+        assert path.name == f"{i:02d}_step_{i}.md"
+
+    tasks.delete_task(spec_slug, "03_step_3.md")
+    assert tasks.get_next_task_number(spec_slug) == 3
+
+    # A task added outside mem is picked up once the directory mtime moves
+    tasks_dir = specs.get_spec_path(spec_slug) / "tasks"
+    (tasks_dir / "07_manual.md").write_text("x")
+    mtime_ns = tasks_dir.stat().st_mtime_ns + 1_000_000_000
+    os.utime(tasks_dir, ns=(mtime_ns, mtime_ns))
+    assert tasks.get_next_task_number(spec_slug) == 8
+
+
+def test_mutating_read_metadata_does_not_change_cache(initialized_mem):
+    """Test that nested frontmatter values are copied out of the read cache."""
+    specs.create_spec("Tagged Spec")
+    specs.update_spec("tagged_spec", tags=["backend"])
+
+    specs.get_spec("tagged_spec")["tags"].append("changed")
+    specs.list_specs(include_body=False)[0]["tags"].append("changed")
+
+    assert specs.get_spec("tagged_spec")["tags"] == ["backend"]
+    assert specs.list_specs(include_body=False)[0]["tags"] == ["backend"]
+
+
+def test_failed_write_leaves_spec_and_no_temp_file(initialized_mem, monkeypatch):
+    """Test that an interrupted write keeps the old spec and cleans up."""
+    from src.utils import markdown
+
+    specs.create_spec("Atomic Spec")
+    spec_file = specs.get_spec_file_path("atomic_spec")
+    original = spec_file.read_text()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(markdown.os, "replace", failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        specs.update_spec_body("atomic_spec", "New body")
+
+    assert spec_file.read_text() == original
+    assert os.listdir(spec_file.parent) == ["spec.md"]
+
+
+def test_header_listings_skip_task_deleted_after_scan(initialized_mem, monkeypatch):
+    """Test that a task removed between the scan and the header read is skipped."""
+    specs.create_spec("Racing Delete")
+    spec_slug = "racing_delete"
+    tasks.create_task(spec_slug, "Keep first", "")
+    tasks.create_task(spec_slug, "Removed task", "")
+    tasks.create_task(spec_slug, "Keep last", "")
+
+    original_scan = tasks._scan_task_files
+
+    def scan_then_delete(tasks_dir):
+        entries = original_scan(tasks_dir)
+        (tasks_dir / "02_removed_task.md").unlink(missing_ok=True)
+        return entries
+
+    monkeypatch.setattr(tasks, "_scan_task_files", scan_then_delete)
+
+    listed = tasks.list_tasks(spec_slug, include_body=False)
+    assert [t["title"] for t in listed] == ["Keep first", "Keep last"]
+    assert tasks.find_task_by_title(spec_slug, "keep last") == "03_keep_last.md"